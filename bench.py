@@ -0,0 +1,162 @@
+"""Benchmark every dayN/solution*.py and write a JSON report.
+
+Each solver exposes `prepare(data)`, which does the parsing, plus `part1`
+and/or `part2`, which take what `prepare` returned. Those three stages are
+timed separately, over some warmup runs and then some measured runs, and
+each solver runs in its own process so that its peak RSS is its own.
+
+Parts are allowed to mutate their input (day4 does), so every part gets a
+freshly prepared puzzle and only the first `prepare` of a run is timed.
+
+    python bench.py --repeat 5 --warmup 1 --out bench.json
+    python bench.py --store /tmp/synthetic 16 17
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import re
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+from statistics import median
+from typing import Any, Dict, List, Optional
+
+from inputs import DirectoryBackend, InputStore
+
+ROOT = Path(__file__).resolve().parent
+STAGES = ('parse', 'part1', 'part2')
+
+Report = Dict[str, Any]
+
+
+def discover(root: Path = ROOT, days: Optional[List[int]] = None) -> List[Path]:
+    def key(p: Path):
+        return int(p.parent.name[3:]), p.name
+    paths = [
+        p for p in root.glob('day*/solution*.py')
+        if re.fullmatch(r'day\d+', p.parent.name)
+    ]
+    if days:
+        paths = [p for p in paths if key(p)[0] in days]
+    return sorted(paths, key=key)
+
+def load(path: Path):
+    name = f"{path.parent.name}_{path.stem.replace('-', '_')}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    # Nearest rank, so p95 is always an observed time.
+    p95 = ordered[max(0, -(-95 * len(ordered) // 100) - 1)]
+    return {
+        'median': median(ordered),
+        'p95': p95,
+        'min': ordered[0],
+        'n': len(ordered),
+    }
+
+def peak_rss() -> int:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def run_solver(path: Path, data: str, repeat: int, warmup: int) -> Report:
+    module = load(path)
+    parts = [s for s in STAGES[1:] if hasattr(module, s)]
+    samples: Dict[str, List[float]] = {s: [] for s in ('parse', *parts)}
+    answers: Dict[str, Any] = {}
+    for i in range(warmup + repeat):
+        measured = i >= warmup
+        t = time.perf_counter()
+        puzzle = module.prepare(data)
+        elapsed = time.perf_counter() - t
+        if measured:
+            samples['parse'].append(elapsed)
+        for part in parts:
+            if puzzle is None:
+                puzzle = module.prepare(data)
+            t = time.perf_counter()
+            answers[part] = getattr(module, part)(puzzle)
+            elapsed = time.perf_counter() - t
+            if measured:
+                samples[part].append(elapsed)
+            puzzle = None
+    return {
+        'stages': {s: summarize(xs) for s, xs in samples.items()},
+        'answers': answers,
+        'peak_rss_bytes': peak_rss(),
+    }
+
+def worker(args: argparse.Namespace):
+    path = Path(args.worker)
+    store = (
+        InputStore(DirectoryBackend(args.store), fetch=False) if args.store
+        else InputStore()
+    )
+    data = store.get_data(int(path.parent.name[3:]))
+    report = run_solver(path, data, args.repeat, args.warmup)
+    json.dump(report, sys.stdout, default=str)
+
+def spawn(path: Path, args: argparse.Namespace) -> Report:
+    cmd = [
+        sys.executable, __file__, '--worker', str(path),
+        '--repeat', str(args.repeat), '--warmup', str(args.warmup),
+    ]
+    if args.store:
+        cmd += ['--store', args.store]
+    try:
+        proc = subprocess.run(
+            cmd, capture_output=True, text=True, timeout=args.timeout,
+            env=os.environ | {'PYTHONPATH': str(ROOT)},
+        )
+    except subprocess.TimeoutExpired:
+        return {'error': f"timed out after {args.timeout}s"}
+    if proc.returncode != 0:
+        return {'error': (proc.stderr.strip().splitlines() or [''])[-1]}
+    return json.loads(proc.stdout)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('days', nargs='*', type=int, help="Only these days.")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--store', help="Read inputs from this store directory only.")
+    parser.add_argument('--timeout', type=float, default=None, help="Per solver, in seconds.")
+    parser.add_argument('--out', default='-', help="Where to write the report.")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        return worker(args)
+
+    report: Report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'warmup': args.warmup,
+        'store': args.store,
+        'solvers': {},
+    }
+    for path in discover(days=args.days):
+        name = str(path.relative_to(ROOT))
+        print(f"Benchmarking {name}", file=sys.stderr)
+        report['solvers'][name] = {'day': int(path.parent.name[3:])} | spawn(path, args)
+
+    out = json.dumps(report, indent=2, default=str)
+    if args.out == '-':
+        print(out)
+    else:
+        Path(args.out).write_text(out)
+
+
+if __name__ == '__main__':
+    main()
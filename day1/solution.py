@@ -1,5 +1,10 @@
-from aocd import get_data
-from typing import List, Set
+from inputs import get_mmap
+from collections import deque
+from multiprocessing import Pool, cpu_count
+import numpy as np
+import sys
+import time
+from typing import List, Set, Dict, Tuple
 from string import digits
 
 Digit = str
@@ -28,6 +33,24 @@ def digits_to_number(digits: List[Digit]) -> int:
         case [x]: return 10*int(x) + int(x)
         case _: return 10*int(digits[0]) + int(digits[-1])
 
+def calibration_sum(buffer: bytes) -> CalibrationValue:
+    """Part 1 over a whole document at once, as a few array passes.
+
+    Takes anything exposing the buffer protocol, so an mmap of a huge file
+    works without a copy.
+    """
+    buf = np.frombuffer(buffer, dtype=np.uint8)
+    positions = np.flatnonzero((buf >= ord('0')) & (buf <= ord('9')))
+    if positions.size == 0:
+        return 0
+    newlines = np.flatnonzero(buf == ord('\n'))
+    # The line a digit is on is the number of newlines before it.
+    lines = np.searchsorted(newlines, positions)
+    changes = lines[1:] != lines[:-1]
+    first = buf[positions[np.r_[True, changes]]] - ord('0')
+    last = buf[positions[np.r_[changes, True]]] - ord('0')
+    return int(10 * first.sum(dtype=np.int64) + last.sum(dtype=np.int64))
+
 def replace_words_with_digits(line: str) -> str:
     while True:
         positions = {
@@ -44,13 +67,150 @@ def replace_words_with_digits(line: str) -> str:
     return line
 
 
+# --- Spelled digit scanner ---
+State = int
+Transitions = List[Dict[str, State]]
+
+def build_automaton(words: Dict[str, Digit]) -> Tuple[Transitions, List[Digit | None]]:
+    """Aho-Corasick automaton recognising every word in a single pass.
+
+    The failure links are folded into a full transition table, so a scan
+    never has to walk them. Characters outside the alphabet go back to the
+    root, which is state 0.
+    """
+    # The trie.
+    trie: Transitions = [{}]
+    output: List[Digit | None] = [None]
+    for word, digit in words.items():
+        s = 0
+        for ch in word:
+            if ch not in trie[s]:
+                trie.append({})
+                output.append(None)
+                trie[s][ch] = len(trie) - 1
+            s = trie[s][ch]
+        output[s] = digit
+    # Breadth first, so a state's failure is always finished before it.
+    alphabet = set(''.join(words))
+    fail: List[State] = [0] * len(trie)
+    delta: Transitions = [{} for _ in trie]
+    queue = deque()
+    for ch in alphabet:
+        delta[0][ch] = trie[0].get(ch, 0)
+        if delta[0][ch]:
+            queue.append(delta[0][ch])
+    while queue:
+        s = queue.popleft()
+        if output[s] is None:
+            output[s] = output[fail[s]]
+        for ch in alphabet:
+            if ch in trie[s]:
+                t = trie[s][ch]
+                fail[t] = delta[fail[s]][ch]
+                delta[s][ch] = t
+                queue.append(t)
+            else:
+                delta[s][ch] = delta[fail[s]][ch]
+    # Only keep the edges that go somewhere other than the root.
+    delta = [{ch: t for ch, t in d.items() if t} for d in delta]
+    return delta, output
+
+DELTA, OUTPUT = build_automaton(REPLACEMENTS | {d: d for d in DIGITS})
+
+def first_and_last_digits(line: str) -> List[Digit]:
+    """The first and last digit in the line, whether numeric or spelled out.
+
+    Overlapping words both count, so "eightwo" is an 8 then a 2.
+    """
+    first = last = None
+    s = 0
+    for ch in line:
+        s = DELTA[s].get(ch, 0)
+        digit = OUTPUT[s]
+        if digit is not None:
+            if first is None:
+                first = digit
+            last = digit
+    return [] if first is None else [first, last]
+
+# --- Parallel mode ---
+ByteRange = Tuple[int, int]
+
+def chunk_ranges(buffer: bytes, n_chunks: int) -> List[ByteRange]:
+    """Split into at most n_chunks byte ranges, each ending on a line end."""
+    size = len(buffer)
+    cuts = [0]
+    for k in range(1, n_chunks):
+        newline = buffer.find(b'\n', max(cuts[-1], k * size // n_chunks))
+        if newline == -1:
+            break
+        cuts.append(newline + 1)
+    cuts.append(size)
+    return [(a, b) for a, b in zip(cuts[:-1], cuts[1:]) if b > a]
+
+def chunk_sum(chunk: bytes, spelled: bool = False) -> CalibrationValue:
+    lines = [line.strip() for line in chunk.decode().split('\n')]
+    if spelled:
+        return sum(digits_to_number(first_and_last_digits(l)) for l in lines)
+    return sum(digits_to_number(d) for d in parse_digits(lines))
+
+def parallel_sum(buffer: bytes, spelled: bool = False, processes: int | None = None) -> CalibrationValue:
+    """Either part, with the lines shared out over a process pool."""
+    processes = processes or cpu_count()
+    ranges = chunk_ranges(buffer, 4 * processes)
+    with Pool(processes) as pool:
+        return sum(pool.starmap(
+            chunk_sum, ((buffer[a:b], spelled) for a, b in ranges)
+        ))
+
+def parallel_speedup(buffer: bytes, processes: int | None = None) -> Dict[str, Dict[str, float]]:
+    report = {}
+    for name, spelled in (("digits", False), ("spelled", True)):
+        t = time.perf_counter()
+        serial = chunk_sum(buffer, spelled)
+        serial_time = time.perf_counter() - t
+        t = time.perf_counter()
+        parallel = parallel_sum(buffer, spelled, processes)
+        parallel_time = time.perf_counter() - t
+        assert serial == parallel, f"{name}: {serial} != {parallel}"
+        report[name] = {
+            "serial": serial_time,
+            "parallel": parallel_time,
+            "speedup": serial_time / parallel_time,
+        }
+    return report
+
+
+# --- Benchmark hooks ---
+def prepare(data: str | bytes) -> bytes:
+    # Part 1 runs on the raw bytes, so an mmap passes straight through.
+    return data.encode() if isinstance(data, str) else data
+
+def part1(buffer: bytes) -> int:
+    return calibration_sum(buffer)
+
+def part2(buffer: bytes) -> int:
+    lines = [line.strip() for line in bytes(buffer).decode().split('\n')]
+    return sum(digits_to_number(first_and_last_digits(line)) for line in lines)
+
+
 if __name__ == '__main__':
-    data: str = get_data(day=1, year=2023)
-    lines: List[str] = [line.strip() for line in data.split('\n')]
+    # python -m day1.solution --speedup 100 times the parallel mode against
+    # the serial one on a synthetic input a hundred times the usual size.
+    if sys.argv[1:2] == ['--speedup']:
+        from generators import generate
+        buffer = generate(1, scale=float(sys.argv[2])).encode()
+        for name, r in parallel_speedup(buffer).items():
+            print(
+                f"{name}: serial {r['serial']:.3f}s, parallel {r['parallel']:.3f}s,"
+                f" speedup {r['speedup']:.2f}x"
+            )
+        sys.exit()
+
+    buffer: bytes = prepare(get_mmap(day=1, year=2023))
 
     # Part 1.
-    print(sum(digits_to_number(d) for d in parse_digits(lines)))
+    print(part1(buffer))
 
     # Part 2
-    lines = [replace_words_with_digits(line) for line in lines]
-    print(sum(digits_to_number(d) for d in parse_digits(lines)))
\ No newline at end of file
+    print(part2(buffer))
@@ -1,4 +1,4 @@
-from aocd import get_data
+from inputs import get_data
 from dataclasses import dataclass
 from typing import List, Self, Dict, Tuple
 from itertools import cycle
@@ -93,21 +93,27 @@ def interior_lattice_points(path: List[Tile]) -> int:
     # number of vertex lattice points.
     return A + 1 - (len(path) - 1) / 2
 
-
-if __name__ == '__main__':
-    data: List[str] = [
-        line.strip()
-        for line in get_data(day=10, year=2023).split('\n')
-    ]
-
-    map = parse(data)
+# --- Benchmark hooks ---
+def prepare(data: str) -> (Tile, Dict[Coordinate, Tile]):
+    map = parse([line.strip() for line in data.split('\n')])
     for _, tile in map.items():
         tile.find_exits(map)
     start = next(tile for tile in map.values() if tile.glyph == 'S')
     amend_exits_adjacent_to_start(start, map)
+    return start, map
+
+def part1(puzzle: (Tile, Dict[Coordinate, Tile])) -> int:
+    path = walk(*puzzle)
+    return len(path) // 2
+
+def part2(puzzle: (Tile, Dict[Coordinate, Tile])) -> int:
+    path = walk(*puzzle)
+    return int(interior_lattice_points(path))
+
+
+if __name__ == '__main__':
+    puzzle = prepare(get_data(day=10, year=2023))
 
-    path = walk(start, map)
-    print(f"The half length of the path is: {len(path) // 2}")
+    print(f"The half length of the path is: {part1(puzzle)}")
 
-    area = interior_lattice_points(path)
-    print(f"The count of interior lattice points is: {int(area)}")
\ No newline at end of file
+    print(f"The count of interior lattice points is: {part2(puzzle)}")
@@ -1,4 +1,4 @@
-from aocd import get_data
+from inputs import get_data
 from dataclasses import dataclass
 from typing import List, Self, Dict, Tuple, Set
 from itertools import combinations
@@ -39,20 +39,23 @@ def find_galaxys(
 def distance(g1: Galaxy, g2: Galaxy) -> int:
     return abs(g1[0] - g2[0]) + abs(g1[1] - g2[1])
 
+# --- Benchmark hooks ---
+def prepare(data: str) -> (List[str], Set[int], Set[int]):
+    lines: List[str] = [line.strip() for line in data.split('\n')]
+    return lines, find_empty_rows(lines), find_empty_columns(lines)
 
-if __name__ == '__main__':
-    data: List[str] = [
-        line.strip()
-        for line in get_data(day=11, year=2023).split('\n')
-    ]
+def part1(universe: (List[str], Set[int], Set[int])) -> int:
+    galaxys = find_galaxys(*universe, expansion_factor=1)
+    return sum(distance(g1, g2) for g1, g2 in combinations(galaxys, r=2))
+
+def part2(universe: (List[str], Set[int], Set[int])) -> int:
+    galaxys = find_galaxys(*universe, expansion_factor=999_999)
+    return sum(distance(g1, g2) for g1, g2 in combinations(galaxys, r=2))
 
-    empty_rows = find_empty_rows(data)
-    empty_cols = find_empty_columns(data)
 
-    galaxys = find_galaxys(data, empty_rows, empty_cols, expansion_factor=1)
-    total = sum(distance(g1, g2) for g1, g2 in combinations(galaxys, r=2))
-    print(f"The total galaxy distance is: {total}")
+if __name__ == '__main__':
+    universe = prepare(get_data(day=11, year=2023))
+
+    print(f"The total galaxy distance is: {part1(universe)}")
 
-    galaxys = find_galaxys(data, empty_rows, empty_cols, expansion_factor=999_999)
-    total = sum(distance(g1, g2) for g1, g2 in combinations(galaxys, r=2))
-    print(f"The total galaxy distance is: {total}")
\ No newline at end of file
+    print(f"The total galaxy distance is: {part2(universe)}")
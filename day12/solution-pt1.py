@@ -1,4 +1,4 @@
-from aocd import get_data
+from inputs import get_data
 from dataclasses import dataclass
 from typing import List, Self, Tuple, Iterator
 
@@ -101,6 +101,15 @@ class Solver:
             yield entry.copy().set(OPERATIONAL).increment()
 
 
+# --- Benchmark hooks ---
+def prepare(data: str) -> List[Tuple[ConditionRecord, ContiguousRecord]]:
+    return [parse_line(l, expand=False) for l in data.split('\n')]
+
+def part1(records: List[Tuple[ConditionRecord, ContiguousRecord]]) -> int:
+    return sum(
+        len(Solver(condition, contiguous).solve().solutions)
+        for condition, contiguous in records
+    )
 
 
 if __name__ == '__main__':
@@ -114,15 +123,6 @@ if __name__ == '__main__':
 ?###???????? 3,2,1
 """
     )
-    data: List[str] = [
-        line.strip()
-        for line in get_data(day=12, year=2023).split('\n')
-    ]
-
-    solvers: List[Solver] = []
-    for condition, contiguous in (parse_line(l, expand=False) for l in data):
-        s = Solver(condition, contiguous).solve()
-        print(f"Solved, with {len(s.solutions)} solutions.")
-        solvers.append(s)
-    total = sum(len(s.solutions) for s in solvers)
-    print(f"There are {total} total solutions")
\ No newline at end of file
+    records = prepare(get_data(day=12, year=2023))
+
+    print(f"There are {part1(records)} total solutions")
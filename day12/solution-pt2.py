@@ -1,4 +1,4 @@
-from aocd import get_data
+from inputs import get_data
 from typing import List, Tuple
 from functools import cache
 
@@ -58,15 +58,18 @@ def is_complete(condition: Condition, contiguous: Contiguous) -> bool:
     damaged_count = condition.count(DAMAGED)
     return not contiguous and (damaged_count == 0)
 
+# --- Benchmark hooks ---
+def prepare(data: str) -> List[Tuple[Condition, Contiguous]]:
+    return [parse_line(line, repeats=5) for line in data.split('\n')]
 
-if __name__ == '__main__':
-    data: List[str] = [
-        line.strip()
-        for line in get_data(day=12, year=2023).split('\n')
-    ]
-
+def part2(records: List[Tuple[Condition, Contiguous]]) -> int:
     solution_counts: List[int] = []
-    for line in data:
-        condition, contiguous = parse_line(line, repeats=5)
+    for condition, contiguous in records:
         solution_counts.append(search(condition, contiguous))
-    print(f"Total solutions counts: {sum(solution_counts)}")
\ No newline at end of file
+    return sum(solution_counts)
+
+
+if __name__ == '__main__':
+    records = prepare(get_data(day=12, year=2023))
+
+    print(f"Total solutions counts: {part2(records)}")
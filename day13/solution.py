@@ -1,4 +1,4 @@
-from aocd import get_data
+from inputs import get_data
 import numpy as np
 from typing import List, Tuple, Optional
 
@@ -39,19 +39,26 @@ def find_vertical_symmetry(x: np.array, n_smudges: int = 0) -> Optional[int]:
             return j
     return None
 
+# --- Benchmark hooks ---
+def prepare(data: str) -> List[Pattern]:
+    return parse(data.split('\n'))
 
-if __name__ == '__main__':
-    data: List[str] = get_data(day=13, year=2023).split('\n')
-    patterns = parse(data)
-
+def part1(patterns: List[Pattern]) -> int:
     symmetries: List[Symmetry] = []
     for pattern in patterns:
         symmetries.append(find_symmetry(pattern))
-    total = sum(o * i for o, i in symmetries)
-    print(f"The total is {total}.")
+    return sum(o * i for o, i in symmetries)
 
+def part2(patterns: List[Pattern]) -> int:
     symmetries: List[Symmetry] = []
     for pattern in patterns:
         symmetries.append(find_symmetry(pattern, n_smudges=1))
-    total = sum(o * i for o, i in symmetries)
-    print(f"The smuged total is {total}.")
\ No newline at end of file
+    return sum(o * i for o, i in symmetries)
+
+
+if __name__ == '__main__':
+    patterns = prepare(get_data(day=13, year=2023))
+
+    print(f"The total is {part1(patterns)}.")
+
+    print(f"The smuged total is {part2(patterns)}.")
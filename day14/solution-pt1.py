@@ -1,4 +1,4 @@
-from aocd import get_data
+from inputs import get_data
 import numpy as np
 from typing import List, Tuple, Optional
 
@@ -35,6 +35,17 @@ def iter_columns(map: Map) -> List[str]:
         yield [map[r][idx] for r in range(len(map))]
 
 
+# --- Benchmark hooks ---
+def prepare(data: str) -> Map:
+    return parse(data.split('\n'))
+
+def part1(map: Map) -> int:
+    load: int = 0
+    for col in iter_columns(map):
+        load += sum(len(map) - p for p in roll_up(col))
+    return load
+
+
 if __name__ == '__main__':
     data = (
 """
@@ -50,16 +61,6 @@ O.#..O.#.#
 #OO..#....
 """
     )
-    data: List[str] = get_data(day=14, year=2023).split('\n')
-    map = parse(data)
-    ROWS, COLS = len(map), len(map[0])
-
-    finals: List[FinalPositions] = []
-    for col in iter_columns(map):
-        print(roll_up(col))
-        finals.append(roll_up(col))
+    map = prepare(get_data(day=14, year=2023))
 
-    load: int = 0
-    for final in finals:
-        load += sum(COLS - p for p in final)
-    print(f"The final load is {load}")
\ No newline at end of file
+    print(f"The final load is {part1(map)}")
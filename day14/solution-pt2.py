@@ -1,10 +1,9 @@
-from aocd import get_data
+from inputs import get_data
 from typing import List, Tuple, Set
 from itertools import cycle
 
-N_ROWS, N_COLS = 100, 100
-
 Coordinate = Tuple[int, int]
+Shape = Tuple[int, int]
 Cubes = Set[Coordinate]
 Rollers = Set[Coordinate]
 
@@ -20,32 +19,34 @@ def parse(data: List[str]) -> Tuple[Cubes, Rollers]:
             if ch == ROLLER: rollers.add((i, j))
     return cubes, rollers
 
-def display(cubes: Cubes, rollers: Rollers):
+def display(cubes: Cubes, rollers: Rollers, shape: Shape):
+    n_rows, n_cols = shape
     rows = []
-    for i in range(N_ROWS):
+    for i in range(n_rows):
         row = []
-        for j in range(N_COLS):
+        for j in range(n_cols):
             if (i, j) in cubes: row.append(CUBE)
             elif (i, j) in rollers: row.append(ROLLER)
             else: row.append(BLANK)
         rows.append(''.join(row))
     print('\n'.join(rows))
 
-def load(rollers: Rollers) -> int:
-    return sum(N_ROWS - i for (i, j) in rollers)
+def load(rollers: Rollers, n_rows: int) -> int:
+    return sum(n_rows - i for (i, j) in rollers)
 
-def flip_vertical(xs: Set[Coordinate]) -> Set[Coordinate]:
-    return {(N_ROWS - i - 1, j) for (i, j) in xs}
+def flip_vertical(xs: Set[Coordinate], n_rows: int) -> Set[Coordinate]:
+    return {(n_rows - i - 1, j) for (i, j) in xs}
 
-def flip_horizontal(xs: Set[Coordinate]) -> Set[Coordinate]:
-    return {(i, N_COLS - j - 1) for (i, j) in xs}
+def flip_horizontal(xs: Set[Coordinate], n_cols: int) -> Set[Coordinate]:
+    return {(i, n_cols - j - 1) for (i, j) in xs}
 
-def roll_north(cubes: Cubes, rollers: Rollers) -> Rollers:
+def roll_north(cubes: Cubes, rollers: Rollers, shape: Shape) -> Rollers:
+    n_rows, n_cols = shape
     final_positions: Rollers = set()
-    for j in range(N_COLS):
+    for j in range(n_cols):
         most_recent_cube_idx: int = -1
         number_of_rollers_seen: int = 0
-        for i in range(N_ROWS):
+        for i in range(n_rows):
             if (i, j) in rollers:
                 number_of_rollers_seen += 1
             if (i, j) in cubes:
@@ -61,17 +62,19 @@ def roll_north(cubes: Cubes, rollers: Rollers) -> Rollers:
             )
     return final_positions
 
-def roll_south(cubes: Cubes, rollers: Rollers) -> Rollers:
-    fcubes = flip_vertical(cubes)
-    frollers = flip_vertical(rollers)
-    return flip_vertical(roll_north(fcubes, frollers))
+def roll_south(cubes: Cubes, rollers: Rollers, shape: Shape) -> Rollers:
+    n_rows, _ = shape
+    fcubes = flip_vertical(cubes, n_rows)
+    frollers = flip_vertical(rollers, n_rows)
+    return flip_vertical(roll_north(fcubes, frollers, shape), n_rows)
 
-def roll_west(cubes: Cubes, rollers: Rollers) -> Rollers:
+def roll_west(cubes: Cubes, rollers: Rollers, shape: Shape) -> Rollers:
+    n_rows, n_cols = shape
     final_positions: Rollers = set()
-    for i in range(N_ROWS):
+    for i in range(n_rows):
         most_recent_cube_idx: int = -1
         number_of_rollers_seen: int = 0
-        for j in range(N_COLS):
+        for j in range(n_cols):
             if (i, j) in rollers:
                 number_of_rollers_seen += 1
             if (i, j) in cubes:
@@ -87,10 +90,11 @@ def roll_west(cubes: Cubes, rollers: Rollers) -> Rollers:
             )
     return final_positions
 
-def roll_east(cubes: Cubes, rollers: Rollers) -> Rollers:
-    fcubes = flip_horizontal(cubes)
-    frollers = flip_horizontal(rollers)
-    return flip_horizontal(roll_west(fcubes, frollers))
+def roll_east(cubes: Cubes, rollers: Rollers, shape: Shape) -> Rollers:
+    _, n_cols = shape
+    fcubes = flip_horizontal(cubes, n_cols)
+    frollers = flip_horizontal(rollers, n_cols)
+    return flip_horizontal(roll_west(fcubes, frollers, shape), n_cols)
 
 
 NORTH, WEST, SOUTH, EAST = 0, 1, 2, 3
@@ -104,9 +108,10 @@ Cycle = Tuple[int, int]
 
 class Solver:
 
-    def __init__(self, cubes: Cubes, rollers: Rollers):
+    def __init__(self, cubes: Cubes, rollers: Rollers, shape: Shape):
         self.cubes = cubes
         self.rollers = rollers
+        self.shape = shape
         self.cache = {}
 
     def solve(self) -> Cycle:
@@ -116,19 +121,25 @@ class Solver:
             if key in self.cache:
                 return self.cache[key], n
             self.cache[key] = n
-            rollers = DIRECTION_TABLE[direction](cubes, rollers)
-
+            rollers = DIRECTION_TABLE[direction](cubes, rollers, self.shape)
 
-if __name__ == '__main__':
-    data: List[str] = get_data(day=14, year=2023).split('\n')
 
+# --- Benchmark hooks ---
+def prepare(data: str) -> Tuple[Cubes, Rollers, Shape]:
+    data = data.split('\n')
     cubes, rollers = parse(data)
+    return cubes, rollers, (len(data), len(data[0]))
 
-    solver = Solver(cubes, rollers)
+def part2(puzzle: Tuple[Cubes, Rollers, Shape]) -> int:
+    solver = Solver(*puzzle)
     start, stop = solver.solve()
-    print(f"Detected cycle from {start} -> {stop}")
-
     N = 1_000_000_000 * 4
     final_idx = (N - start) % (stop - start) + start
     _, finalrollers = next(k for k, v in solver.cache.items() if v == final_idx)
-    print(f"The final load is {load(finalrollers)}")
\ No newline at end of file
+    return load(finalrollers, solver.shape[0])
+
+
+if __name__ == '__main__':
+    puzzle = prepare(get_data(day=14, year=2023))
+
+    print(f"The final load is {part2(puzzle)}")
@@ -1,4 +1,4 @@
-from aocd import get_data
+from inputs import get_data
 from abc import abstractmethod
 from dataclasses import dataclass
 from typing import List, Dict
@@ -117,15 +117,17 @@ RESIDUES_MOD_256 = residues_kp_mod_n(17, 256)
 def evaluate(step: str) -> int:
     return sum(ord(c) * r for c, r in zip(reversed(step), RESIDUES_MOD_256)) % 256
 
+# --- Benchmark hooks ---
+def prepare(data: str) -> List[Instruction]:
+    return parse(data.split('\n')[0])
 
-if __name__ == '__main__':
-    data = get_data(day=15, year=2023).split('\n')[0]
-
+def part2(program: List[Instruction]) -> int:
     facility = Facility()
-    program = parse(data)
     facility.run(program)
+    return facility.power
 
-    for i, b in facility.boxes.items():
-        print(i, b)
 
-    print(f"The total focusing power is {facility.power}")
\ No newline at end of file
+if __name__ == '__main__':
+    program = prepare(get_data(day=15, year=2023))
+
+    print(f"The total focusing power is {part2(program)}")
@@ -1,12 +1,10 @@
-from aocd import get_data
+from inputs import get_data
 from abc import abstractmethod
 from enum import Enum
 from dataclasses import dataclass
 from itertools import product
 from typing import List, Tuple, List, Set
 
-N_ROW, N_COL = 110, 110
-
 EMPTY = '.'
 BACK_MIRROR = '/'
 FORWARD_MIRROR = '\\'
@@ -72,11 +70,10 @@ class Photon:
             case x:
                 raise ValueError(f"Awww shit {x}.")
 
-    @property
-    def in_bounds(self):
+    def in_bounds(self, map: Map) -> bool:
         return (
-            (0 <= self.position[0] < N_ROW)
-            and (0 <= self.position[1] < N_COL)
+            (0 <= self.position[0] < len(map))
+            and (0 <= self.position[1] < len(map[0]))
         )
 
 
@@ -94,7 +91,7 @@ class Simulation:
     def run(self, map: Map) -> "Simulation":
         while self.photons:
             photon = self.photons.pop()
-            if (not photon.in_bounds) or (photon in self.history):
+            if (not photon.in_bounds(map)) or (photon in self.history):
                 continue
             self.history.add(photon)
             self.illuminated.add(photon.position)
@@ -102,18 +99,19 @@ class Simulation:
             self.photons.extend(newphons)
         return self
 
-def iter_initial_photons():
-    for i in range(N_ROW):
+def iter_initial_photons(map: Map):
+    n_row, n_col = len(map), len(map[0])
+    for i in range(n_row):
         yield Photon((i, 0), Direction.EAST)
-        yield Photon((i, N_COL - 1), Direction.WEST)
-    for j in range(N_COL):
+        yield Photon((i, n_col - 1), Direction.WEST)
+    for j in range(n_col):
         yield Photon((0, j), Direction.SOUTH)
         yield Photon((0, j), Direction.NORTH)
 
 def solve(map: Map) -> int:
     seen: Set[Photon] = set()
     M = 0
-    for p in iter_initial_photons():
+    for p in iter_initial_photons(map):
         if p in seen:
             continue
         s = Simulation(p).run(map)
@@ -121,13 +119,22 @@ def solve(map: Map) -> int:
         seen.update(s.history)
     return M
 
-if __name__ == '__main__':
-    map: Map = get_data(day=16, year=2023).split('\n')
-    map = [list(row) for row in map]
+# --- Benchmark hooks ---
+def prepare(data: str) -> Map:
+    return [list(row) for row in data.split('\n')]
 
+def part1(map: Map) -> int:
     λ = Photon((0, 0), Direction.EAST)
     s = Simulation(λ).run(map)
-    print(f"The number of illuminated tiles is {len(s.illuminated)}")
+    return len(s.illuminated)
+
+def part2(map: Map) -> int:
+    return solve(map)
+
+
+if __name__ == '__main__':
+    map: Map = prepare(get_data(day=16, year=2023))
+
+    print(f"The number of illuminated tiles is {part1(map)}")
 
-    M = solve(map)
-    print(f"The maximum illumination is:{M}")
\ No newline at end of file
+    print(f"The maximum illumination is:{part2(map)}")
@@ -1,11 +1,9 @@
-from aocd import get_data
+from inputs import get_data
 from enum import Enum
 from dataclasses import dataclass, field
 from queue import PriorityQueue
 from typing import List, Tuple, List, Set, Iterable
 
-N_ROW, N_COL = 141, 141
-
 Coordinate = Tuple[int, int]
 Map = List[str]
 
@@ -57,13 +55,6 @@ class Node:
             else:
                 yield Node((c[0] + nd[0], c[1] + nd[1]), nd, 1)
 
-    @property
-    def in_bounds(self):
-        return (
-            (0 <= self.coordinate[0] < N_ROW)
-            and (0 <= self.coordinate[1] < N_COL)
-        )
-
 
 @dataclass(order=True)
 class SearchStep:
@@ -75,33 +66,48 @@ class Solver:
 
     def __init__(self, map: Map):
         self.map = map
+        self.n_row, self.n_col = len(map), len(map[0])
         self.queue: PriorityQueue[SearchStep] = PriorityQueue()
         self.seen: Set[Node] = set()
 
+    def in_bounds(self, node: Node) -> bool:
+        return (
+            (0 <= node.coordinate[0] < self.n_row)
+            and (0 <= node.coordinate[1] < self.n_col)
+        )
+
     def solve(self, start: Node, end: Coordinate):
         self.queue.put(SearchStep(start, 0))
         current: SearchStep = None
         while True:
             current = self.queue.get()
             node = current.node
-            if node in self.seen or not node.in_bounds:
+            if node in self.seen or not self.in_bounds(node):
                 continue
             self.seen.add(node)
             c = node.coordinate
             if c == end and node.times >= 4:
-                return current.loss + int(map[c[0]][c[1]])
+                return current.loss + int(self.map[c[0]][c[1]])
             for nxt in node.ultranexts():
                 self.queue.put(
-                    SearchStep(nxt, current.loss + int(map[c[0]][c[1]]))
+                    SearchStep(nxt, current.loss + int(self.map[c[0]][c[1]]))
                 )
 
 
-if __name__ == '__main__':
-    map: Map = get_data(day=17, year=2023).split('\n')
+# --- Benchmark hooks ---
+def prepare(data: str) -> Map:
+    return data.split('\n')
 
+def part2(map: Map) -> int:
     s = Solver(map)
     loss = s.solve(
         Node((0, 0), Direction.NORTH, 10),
-        (N_ROW - 1, N_COL - 1)
+        (s.n_row - 1, s.n_col - 1)
     )
-    print(f"The minimum loss is {loss - int(map[0][0])}")
\ No newline at end of file
+    return loss - int(map[0][0])
+
+
+if __name__ == '__main__':
+    map: Map = prepare(get_data(day=17, year=2023))
+
+    print(f"The minimum loss is {part2(map)}")
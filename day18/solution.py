@@ -1,4 +1,4 @@
-from aocd import get_data
+from inputs import get_data
 from enum import Enum
 from math import copysign
 from dataclasses import dataclass
@@ -79,11 +79,19 @@ def area(program: Program) -> int:
     A = copysign(A, 1.0)
     return A + (N + 2) / 2
 
+# --- Benchmark hooks ---
+def prepare(data: str) -> Program:
+    return [parse(line) for line in data.split('\n')]
+
+def part1(program: Program) -> int:
+    return int(area(program))
+
+def part2(program: Program) -> int:
+    return int(area([i.from_rgb() for i in program]))
+
 
 if __name__ == '__main__':
-    data = get_data(day=18, year=2023).split('\n')
-    program: Program = [parse(line) for line in data]
-    print(f"The area of the hole is {area(program)}")
+    program: Program = prepare(get_data(day=18, year=2023))
+    print(f"The area of the hole is {part1(program)}")
 
-    program = [i.from_rgb() for i in program]
-    print(f"The area of the giant hole is {area(program)}")
+    print(f"The area of the giant hole is {part2(program)}")
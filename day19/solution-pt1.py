@@ -1,4 +1,4 @@
-from aocd import get_data
+from inputs import get_data
 import json
 from dataclasses import dataclass
 from typing import List, Tuple, List, Iterator, Dict
@@ -129,6 +129,18 @@ def rating(part: Part) -> int:
     return sum(part.values())
 
 
+# --- Benchmark hooks ---
+def prepare(data: str) -> Tuple[Program, List[Part]]:
+    return parse(data.split('\n'))
+
+def part1(puzzle: Tuple[Program, List[Part]]) -> int:
+    program, parts = puzzle
+    return sum(
+        rating(part) for part in parts
+        if program.execute(part, start="in") == ACCEPT
+    )
+
+
 if __name__ == '__main__':
 #     data = (
 # """
@@ -151,18 +163,6 @@ if __name__ == '__main__':
 # {x=2127,m=1623,a=2188,s=1013}
 # """.strip().split('\n')
 #     )
-    data = get_data(day=19, year=2023).split('\n')
-    program, parts = parse(data)
-
-    accepted, rejected = [], []
-    for part in parts:
-        result = program.execute(part, start="in")
-        if result == ACCEPT:
-            accepted.append(part)
-        elif result == REJECT:
-            rejected.append(part)
-        else:
-            print(f"Part was niether accepted or rejected: {part}")
-    print(f"Accepted: {len(accepted)}, Rejected {len(rejected)}")
-    print(f"Total rating for accepted parts: {sum(rating(p) for p in accepted)}")
+    puzzle = prepare(get_data(day=19, year=2023))
 
+    print(f"Total rating for accepted parts: {part1(puzzle)}")
@@ -1,4 +1,4 @@
-from aocd import get_data
+from inputs import get_data
 from dataclasses import dataclass
 from typing import List, Tuple, List, Iterator, Dict
 
@@ -124,14 +124,22 @@ def parse_subroutine(line: str) -> Tuple[Tag, Subroutine]:
 def volume(space: Space) -> int:
     return len(space['x']) * len(space['m']) * len(space['a']) * len(space['s'])
 
-if __name__ == '__main__':
-    data = get_data(day=19, year=2023).split('\n')
-    program = parse(data)
+# --- Benchmark hooks ---
+def prepare(data: str) -> Program:
+    program = parse(data.split('\n'))
     program.subroutines['A'] = Subroutine('A', [ACCEPT])
     program.subroutines['R'] = Subroutine('R', [REJECT])
+    return program
 
+def part2(program: Program) -> int:
     space = {k: range(1, 4001) for k in 'xmas'}
     accepted = []
     for s in program.executeall('in', space):
         accepted.append(s)
-    print(f"The total number of accepted parts is: {sum(volume(a) for a in accepted)}")
\ No newline at end of file
+    return sum(volume(a) for a in accepted)
+
+
+if __name__ == '__main__':
+    program = prepare(get_data(day=19, year=2023))
+
+    print(f"The total number of accepted parts is: {part2(program)}")
@@ -1,6 +1,8 @@
-from aocd import get_data
+from inputs import get_data
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from functools import cached_property
+import numpy as np
+from typing import Iterable, List, Dict, Tuple
 
 @dataclass
 class Round:
@@ -44,30 +46,168 @@ def minimum_cubes(game: Game) -> Round:
         green = max(round.green for round in game)
     )
 
+# --- Columnar games ---
+# Column order of the cube counts in a GameTable.
+COLORS = {"red": 0, "green": 1, "blue": 2}
+
+@dataclass
+class GameTable:
+    """Every game in a log, as flat arrays rather than objects.
+
+    Game i's rounds are the rows offsets[i]:offsets[i + 1] of counts, which
+    holds the red, green and blue cubes shown in each round.
+    """
+    ids: np.ndarray
+    offsets: np.ndarray
+    counts: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @cached_property
+    def maxima(self) -> np.ndarray:
+        """The fewest cubes of each colour each game could be played with.
+
+        Computed on first use and shared by both parts and BagIndex.
+        """
+        return np.maximum.reduceat(self.counts, self.offsets, axis=0)
+
+def parse_table(lines: Iterable[str]) -> GameTable:
+    ids: List[GameId] = []
+    offsets: List[int] = []
+    counts: List[List[int]] = []
+    for line in lines:
+        prefix, suffix = line.split(':')
+        ids.append(int(prefix.split()[1]))
+        offsets.append(len(counts))
+        for roundstr in suffix.split(';'):
+            rgb = [0, 0, 0]
+            for cubestr in roundstr.split(','):
+                n, color = cubestr.split()
+                rgb[COLORS[color]] = int(n)
+            counts.append(rgb)
+    return GameTable(
+        np.array(ids, dtype=np.int64),
+        np.array(offsets, dtype=np.int64),
+        np.array(counts, dtype=np.int64).reshape(-1, 3),
+    )
+
+def valid_id_sum(table: GameTable, bag: Round = MAX_ROUND) -> int:
+    limit = np.array([bag.red, bag.green, bag.blue])
+    valid = np.all(table.maxima <= limit, axis=1)
+    return int(table.ids[valid].sum())
+
+class BagIndex:
+    """Answers "which games fit in this bag?" for any bag, without a rescan.
+
+    Built once over the per-game maxima, as a k-d tree: the games are split
+    in half along red, green and blue in turn, down to leaves of LEAF_SIZE
+    games, and every node keeps its bounding box, game count and id sum. A
+    query adds up the nodes whose box fits entirely in the bag, drops the
+    ones that cannot fit at all, and only looks inside the rest, which is
+    O(n**(2/3)) nodes at worst. Memory is linear in the number of games.
+    """
+    LEAF_SIZE = 32
+    # Bags answered together, which bounds the size of the search frontier.
+    QUERY_CHUNK = 256
+
+    def __init__(self, table: GameTable):
+        maxima, ids = table.maxima, table.ids
+        n = len(ids)
+        depth = int(np.ceil(np.log2(n / self.LEAF_SIZE))) if n > self.LEAF_SIZE else 0
+        order = np.arange(n)
+        cuts = np.array([0, n])
+        for d in range(depth):
+            # Sort each node's games along this level's colour, then halve it.
+            node = np.repeat(np.arange(len(cuts) - 1), np.diff(cuts))
+            order = order[np.lexsort((maxima[order, d % 3], node))]
+            halved = np.empty(2 * len(cuts) - 1, dtype=np.int64)
+            halved[0::2] = cuts
+            halved[1::2] = (cuts[:-1] + cuts[1:]) // 2
+            cuts = halved
+        self.points = maxima[order]
+        self.ids = ids[order]
+        self.cuts = cuts
+
+        # The leaves, then each level up from its pairs of children.
+        self.levels: List[Tuple[np.ndarray, ...]] = []
+        if n:
+            level = (
+                np.minimum.reduceat(self.points, cuts[:-1], axis=0),
+                np.maximum.reduceat(self.points, cuts[:-1], axis=0),
+                np.diff(cuts),
+                np.add.reduceat(self.ids, cuts[:-1]),
+            )
+            self.levels.append(level)
+            while len(level[0]) > 1:
+                lo, hi, counts, id_sums = level
+                level = (
+                    np.minimum(lo[0::2], lo[1::2]),
+                    np.maximum(hi[0::2], hi[1::2]),
+                    counts[0::2] + counts[1::2],
+                    id_sums[0::2] + id_sums[1::2],
+                )
+                self.levels.append(level)
+            self.levels.reverse()
+
+    def query(self, bags: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Count and id sum of the games fitting each (red, green, blue) bag."""
+        bags = np.atleast_2d(np.asarray(bags, dtype=np.int64))
+        counts = np.zeros(len(bags), dtype=np.int64)
+        id_sums = np.zeros(len(bags), dtype=np.int64)
+        if self.levels:
+            for start in range(0, len(bags), self.QUERY_CHUNK):
+                q = np.arange(start, min(start + self.QUERY_CHUNK, len(bags)))
+                self._search(bags, q, counts, id_sums)
+        return counts, id_sums
+
+    def _search(self, bags: np.ndarray, q: np.ndarray, counts: np.ndarray, id_sums: np.ndarray):
+        # The frontier is (bag, node) pairs, walked down one level at a time.
+        node = np.zeros(len(q), dtype=np.int64)
+        for d, (lo, hi, level_counts, level_id_sums) in enumerate(self.levels):
+            bag = bags[q]
+            inside = np.all(hi[node] <= bag, axis=1)
+            np.add.at(counts, q[inside], level_counts[node[inside]])
+            np.add.at(id_sums, q[inside], level_id_sums[node[inside]])
+            partial = ~inside & np.all(lo[node] <= bag, axis=1)
+            q, node = q[partial], node[partial]
+            if d + 1 < len(self.levels):
+                q = np.repeat(q, 2)
+                node = 2 * np.repeat(node, 2) + np.tile([0, 1], len(node))
+        # What is left straddles a leaf, so check its games one by one.
+        starts, stops = self.cuts[node], self.cuts[node + 1]
+        width = int((stops - starts).max(initial=0))
+        games = starts[:, None] + np.arange(width)
+        valid = games < stops[:, None]
+        games = np.minimum(games, len(self.ids) - 1)
+        fits = valid & np.all(self.points[games] <= bags[q][:, None, :], axis=2)
+        np.add.at(counts, q, fits.sum(axis=1))
+        np.add.at(id_sums, q, (fits * self.ids[games]).sum(axis=1))
+
+    def fits(self, bag: Round) -> Tuple[int, int]:
+        counts, id_sums = self.query(np.array([bag.red, bag.green, bag.blue]))
+        return int(counts[0]), int(id_sums[0])
+
+def power_sum(table: GameTable) -> int:
+    return int(np.prod(table.maxima, axis=1, dtype=np.int64).sum())
+
+
+# --- Benchmark hooks ---
+def prepare(data: str) -> GameTable:
+    return parse_table(l.strip() for l in data.split('\n'))
+
+def part1(table: GameTable) -> int:
+    return valid_id_sum(table)
+
+def part2(table: GameTable) -> int:
+    return power_sum(table)
+
 
 if __name__ == '__main__':
-    data: List[str] = [
-        line.strip()
-        for line in get_data(day=2, year=2023).split('\n')
-    ]
-    games: Dict[GameId, Game] = {
-        id: game
-        for id, game in map(parse_line, data)
-    }
+    games: GameTable = prepare(get_data(day=2, year=2023))
 
     # Part 1
-    valid_game_ids = [
-        id
-        for id, game in games.items()
-        if is_valid_game(game)
-    ]
-    print(f"Sum of valid game ids: {sum(valid_game_ids)}")
+    print(f"Sum of valid game ids: {part1(games)}")
 
     # Part 2
-    mcubes = {
-        id: minimum_cubes(game) for id, game in games.items()
-    }
-    powers = [
-        r.red * r.blue * r.green for r in mcubes.values()
-    ]
-    print(f"Sum of powers of minimum games: {sum(powers)}")
\ No newline at end of file
+    print(f"Sum of powers of minimum games: {part2(games)}")
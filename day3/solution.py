@@ -1,7 +1,9 @@
-from aocd import get_data
+from inputs import get_mmap
+from collections import deque
 from dataclasses import dataclass
+import numpy as np
 from string import digits
-from typing import List, Set, Dict, Tuple
+from typing import List, Set, Dict, Tuple, Iterable, Iterator, Deque
 
 NON_SYMBOLS = digits + '.'
 
@@ -80,7 +82,14 @@ def adjacent_glyphs(number: Number, data: List[str]) -> Set[str]:
         adjacents.add(data[number.row][number.boundary[1] + 1])
     return adjacents
 
-def find_gears_adjacent_to_number(number: Number, gear_table: GearTable) -> Number:
+# Symbol coordinate -> every number adjacent to that symbol.
+AdjacencyIndex = Dict[Tuple[int, int], List[Number]]
+
+def find_gears_adjacent_to_number(
+    number: Number,
+    gear_table: GearTable,
+    index: AdjacencyIndex | None = None
+) -> Number:
     adjacents: List[Symbol] = []
     adjacents.extend(
         gear_table.get((number.row - 1, col))
@@ -97,8 +106,29 @@ def find_gears_adjacent_to_number(number: Number, gear_table: GearTable) -> Numb
         gear_table.get((number.row, number.boundary[1] + 1))
     )
     number.adjacent_gears = [gear for gear in adjacents if gear]
+    if index is not None:
+        for gear in number.adjacent_gears:
+            index.setdefault(gear.coordinate, []).append(number)
     return number
 
+def build_adjacency_index(numbers: List[Number], table: GearTable) -> AdjacencyIndex:
+    """Which numbers touch each symbol in the table, in one pass over numbers.
+
+    Pass the gear table for gear ratios, or a table of any other symbols
+    for their own adjacency questions.
+    """
+    index: AdjacencyIndex = {}
+    for number in numbers:
+        find_gears_adjacent_to_number(number, table, index)
+    return index
+
+def gear_ratios(index: AdjacencyIndex) -> List[int]:
+    return [
+        adjacents[0].value * adjacents[1].value
+        for adjacents in index.values()
+        if len(adjacents) == 2
+    ]
+
 def find_numbers_adjacent_to_gears(gear: Symbol, numbers: List[Number]) -> List[Number]:
     adjacents: List[Number] = []
     for n in numbers:
@@ -106,14 +136,135 @@ def find_numbers_adjacent_to_gears(gear: Symbol, numbers: List[Number]) -> List[
             adjacents.append(n)
     return adjacents
 
+# --- Grid engine ---
+def schematic_grid(buffer: bytes) -> np.ndarray:
+    """The schematic as a uint8 array, keeping each row's newline.
 
-if __name__ == '__main__':
-    data: List[str] = [
-        line.strip()
-        for line in get_data(day=3, year=2023).split('\n')
-    ]
-    glyphs = all_glyphs(data)
-    symbols = collect_symbols(data, glyphs)
+    The newline column separates digit runs on neighbouring rows, and
+    when the buffer already ends in a newline this is a view, not a copy.
+    """
+    buf = np.frombuffer(buffer, dtype=np.uint8)
+    if buf.size and buf[-1] != ord('\n'):
+        buf = np.append(buf, np.uint8(ord('\n')))
+    width = int(np.argmax(buf == ord('\n'))) + 1
+    return buf.reshape(-1, width)
+
+def part_number_sum(buffer: bytes) -> int:
+    """Part 1 in array passes: dilate the symbols, then test each digit run."""
+    grid = schematic_grid(buffer)
+    n_rows, n_cols = grid.shape
+    is_digit = (grid >= ord('0')) & (grid <= ord('9'))
+    is_symbol = ~is_digit & (grid != ord('.')) & (grid != ord('\n'))
+    padded = np.pad(is_symbol, 1)
+    near_symbol = np.zeros_like(is_symbol)
+    for di in range(3):
+        for dj in range(3):
+            near_symbol |= padded[di:di + n_rows, dj:dj + n_cols]
+
+    # Digit runs in the flattened grid, as [start, end) pairs. A run never
+    # crosses a row, since every row ends in a newline.
+    flat = is_digit.ravel()
+    edges = np.diff(flat.astype(np.int8), prepend=0)
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    if starts.size == 0:
+        return 0
+    bounds = np.column_stack([starts, ends]).ravel()
+    is_part = np.logical_or.reduceat(near_symbol.ravel(), bounds)[::2]
+
+    # Each digit is worth 10 to the power of how many digits follow it in
+    # its run.
+    run = np.cumsum(edges == 1) - 1
+    positions = np.flatnonzero(flat)
+    places = ends[run[positions]] - 1 - positions
+    values = (grid.ravel()[positions] - ord('0')).astype(np.int64) * 10**places
+    numbers = np.add.reduceat(values, np.searchsorted(positions, starts))
+    return int(numbers[is_part].sum())
+
+
+# --- Streaming mode ---
+@dataclass
+class WindowRow:
+    row: int
+    line: str
+    numbers: List[Number]
+    # Column -> the number with a digit in that column.
+    covers: Dict[int, Number]
+
+def window_row(row: int, line: str) -> WindowRow:
+    numbers = parse_numbers_from_line(row, line)
+    covers = {
+        col: n for n in numbers
+        for col in range(n.boundary[0], n.boundary[1] + 1)
+    }
+    return WindowRow(row, line, numbers, covers)
+
+def settle(current: WindowRow, window: Iterable[WindowRow]) -> Tuple[int, int, int]:
+    """Part number and gear ratio sums for a row, given the rows around it."""
+    neighbours = [w for w in window if abs(w.row - current.row) <= 1]
+    part_sum = 0
+    for n in current.numbers:
+        begin, end = max(0, n.boundary[0] - 1), n.boundary[1] + 2
+        if any(ch not in NON_SYMBOLS for w in neighbours for ch in w.line[begin:end]):
+            part_sum += n.value
+    ratio_sum = 0
+    for col, ch in enumerate(current.line):
+        if ch != '*':
+            continue
+        adjacents = {
+            id(n): n for w in neighbours
+            for c in (col - 1, col, col + 1)
+            if (n := w.covers.get(c)) is not None
+        }
+        if len(adjacents) == 2:
+            a, b = adjacents.values()
+            ratio_sum += a.value * b.value
+    return current.row, part_sum, ratio_sum
+
+def stream_schematic(lines: Iterable[str]) -> Iterator[Tuple[int, int, int]]:
+    """Yields (row, part number sum, gear ratio sum) for each row in turn.
+
+    Rows are read lazily and at most three are held at once: a row is
+    settled as soon as the row below it has been read, since adjacency
+    never reaches further, so memory stays flat however long the
+    schematic is. Works straight off a file, e.g. stream_schematic(open(path)).
+    """
+    window: Deque[WindowRow] = deque(maxlen=3)
+    row = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        window.append(window_row(row, line))
+        row += 1
+        if len(window) >= 2:
+            yield settle(window[-2], window)
+    if window:
+        yield settle(window[-1], window)
+
+def stream_totals(lines: Iterable[str]) -> Tuple[int, int]:
+    part_total, ratio_total = 0, 0
+    for _, part_sum, ratio_sum in stream_schematic(lines):
+        part_total += part_sum
+        ratio_total += ratio_sum
+    return part_total, ratio_total
+
+
+# --- Benchmark hooks ---
+@dataclass
+class Schematic:
+    buffer: bytes
+    data: List[str]
+    glyphs: Set[str]
+    gear_table: GearTable
+    numbers: List[Number]
+
+def prepare(data: str | bytes) -> Schematic:
+    # Part 1 runs on the raw bytes, so an mmap passes straight through.
+    buffer = data.encode() if isinstance(data, str) else data
+    text = data if isinstance(data, str) else bytes(data).decode()
+    lines: List[str] = [line.strip() for line in text.split('\n')]
+    glyphs = all_glyphs(lines)
+    symbols = collect_symbols(lines, glyphs)
 
     gear_table: GearTable = {
         (sym.coordinate[0], sym.coordinate[1]): sym
@@ -122,22 +273,21 @@ if __name__ == '__main__':
     }
 
     numbers: List[Number] = []
-    for row, line in enumerate(data):
+    for row, line in enumerate(lines):
         numbers.extend(parse_numbers_from_line(row, line))
+    return Schematic(buffer, lines, glyphs, gear_table, numbers)
 
-    part_numbers = [
-        n for n in numbers
-        if adjacent_glyphs(n, data) & glyphs
-    ]
-    print(f"Sum of all part numbers: {sum(n.value for n in part_numbers)}")
+def part1(schematic: Schematic) -> int:
+    return part_number_sum(schematic.buffer)
 
-    for number in numbers:
-        _ = find_gears_adjacent_to_number(number, gear_table)
+def part2(schematic: Schematic) -> int:
+    index = build_adjacency_index(schematic.numbers, schematic.gear_table)
+    return sum(gear_ratios(index))
 
-    ratios: List[int] = []
-    gears = list(gear_table.values())
-    for gear in gears:
-        adjacents = find_numbers_adjacent_to_gears(gear, numbers)
-        if len(adjacents) == 2:
-            ratios.append(adjacents[0].value * adjacents[1].value)
-    print(f"The sum of the gear ratios is: {sum(ratios)}")
+
+if __name__ == '__main__':
+    schematic = prepare(get_mmap(day=3, year=2023))
+
+    print(f"Sum of all part numbers: {part1(schematic)}")
+
+    print(f"The sum of the gear ratios is: {part2(schematic)}")
@@ -1,56 +1,169 @@
-from aocd import get_data
-from dataclasses import dataclass
+from inputs import get_data
+from collections import deque
+from dataclasses import dataclass, field
+import numpy as np
 from string import digits
-from typing import List, Set, Dict, Tuple
+from typing import List, Set, Dict, Tuple, Iterable, Iterator, Deque
 
-@dataclass
+# A set of small numbers, as an int with bit k set when k is in the set.
+Bitset = int
+
+@dataclass(slots=True)
 class Card:
     n: int
-    winning: Set[int]
-    have: Set[int]
+    winning: Bitset
+    have: Bitset
     copies: int = 1
+    n_matches: int = field(init=False)
+
+    def __post_init__(self):
+        self.n_matches = (self.have & self.winning).bit_count()
 
     @property
     def matches(self) -> Set[int]:
-        return self.have & self.winning
+        common = self.have & self.winning
+        return {k for k in range(common.bit_length()) if common >> k & 1}
 
     @property
     def points(self) -> int:
-        if not self.matches:
+        if not self.n_matches:
             return 0
-        return 2**(len(self.matches) - 1)
+        return 2**(self.n_matches - 1)
+
+def to_bitset(numbers: Iterable[int]) -> Bitset:
+    bits = 0
+    for k in numbers:
+        bits |= 1 << k
+    return bits
 
 def parse_line(line: str) -> Card:
     cardstr, numberstr = line.split(':')
     *_, cardnumstr = cardstr.split(' ')
     winningstr, havestr = numberstr.split('|')
-    winnings = {int(s) for s in winningstr.split()}
-    havings = {int(s) for s in havestr.split()}
+    winnings = to_bitset(int(s) for s in winningstr.split())
+    havings = to_bitset(int(s) for s in havestr.split())
     return Card(int(cardnumstr), winnings, havings)
 
+def propagate_copies(cards: Iterable[Card]) -> Iterator[Card]:
+    """Settle each card's copies as it streams past, in card order.
+
+    pending[k] holds the copies won so far of the k-th card still to come,
+    so it never grows beyond the largest match count, and the whole deck
+    takes O(cards + total matches).
+    """
+    pending: Deque[int] = deque()
+    for card in cards:
+        if pending:
+            card.copies += pending.popleft()
+        while len(pending) < card.n_matches:
+            pending.append(0)
+        for k in range(card.n_matches):
+            pending[k] += card.copies
+        yield card
+
 def reduce_cards(ogcards: List[Card]) -> List[Card]:
-    ogcards = list(reversed(ogcards)) # We pop off the END of lists.
-    endcards: List[Card] = []
-    while ogcards:
-        card = ogcards.pop()
-        endcards.append(card)
-        n_matches = len(card.matches)
-        match_range = set(range(card.n + 1, card.n + n_matches + 1))
-        for remainingcard in ogcards:
-            if remainingcard.n in match_range:
-                remainingcard.copies += card.copies
-    return endcards
+    return list(propagate_copies(ogcards))
+
+# --- Whole deck scoring ---
+@dataclass
+class Deck:
+    """Every card's numbers, one row per card, in card order."""
+    winning: np.ndarray
+    have: np.ndarray
+
+def parse_deck(buffer: bytes) -> Deck:
+    """The deck as two integer matrices, straight from the raw input.
+
+    The puzzle right aligns every number in a three character slot, so all
+    the cards share the same columns and the deck can be read as one uint8
+    array. Anything laid out differently goes through parse_deck_lines.
+    """
+    buf = np.frombuffer(buffer, dtype=np.uint8)
+    if buf.size == 0:
+        return parse_deck_lines([])
+    if buf[-1] != ord('\n'):
+        buf = np.append(buf, np.uint8(ord('\n')))
+    width = int(np.argmax(buf == ord('\n'))) + 1
+    if buf.size % width:
+        return parse_deck_lines(bytes(buffer).decode().split('\n'))
+    grid = buf.reshape(-1, width)
+    first = grid[0].tobytes()
+    colon, bar = first.index(b':'), first.index(b'|')
+    aligned = (
+        (grid[:, -1] == ord('\n')).all()
+        and (grid[:, colon] == ord(':')).all()
+        and (grid[:, bar] == ord('|')).all()
+        and (bar - colon - 2) % 3 == 0
+        and (width - bar - 2) % 3 == 0
+    )
+    if not aligned:
+        return parse_deck_lines(bytes(buffer).decode().split('\n'))
+    def slots(begin: int, end: int) -> np.ndarray:
+        tens = grid[:, begin + 1:end:3].astype(np.int64)
+        units = grid[:, begin + 2:end:3].astype(np.int64)
+        return np.where(tens == ord(' '), 0, tens - ord('0')) * 10 + units - ord('0')
+    return Deck(slots(colon + 1, bar - 1), slots(bar + 1, width - 1))
+
+def parse_deck_lines(lines: Iterable[str]) -> Deck:
+    rows = [line.split(':')[1].split('|') for line in lines if line.strip()]
+    if not rows:
+        return Deck(np.zeros((0, 0), np.int64), np.zeros((0, 0), np.int64))
+    n_winning = len(rows[0][0].split())
+    numbers = np.array(
+        ' '.join(w + ' ' + h for w, h in rows).split(), dtype=np.int64
+    ).reshape(len(rows), -1)
+    return Deck(numbers[:, :n_winning], numbers[:, n_winning:])
+
+def match_counts(deck: Deck) -> np.ndarray:
+    """How many held numbers are winning numbers, for every card at once."""
+    n_cards = len(deck.winning)
+    if n_cards == 0:
+        return np.zeros(0, dtype=np.int64)
+    # A row per card marking its winning numbers, then look up the held ones.
+    winning = np.zeros((n_cards, deck.winning.max() + 1), dtype=bool)
+    rows = np.arange(n_cards)[:, None]
+    winning[rows, deck.winning] = True
+    have = np.minimum(deck.have, winning.shape[1] - 1)
+    hits = winning[rows, have] & (deck.have < winning.shape[1])
+    return hits.sum(axis=1)
+
+def deck_points(matches: np.ndarray) -> int:
+    return int(np.where(matches > 0, 2**np.maximum(matches - 1, 0), 0).sum())
+
+def deck_copies(matches: np.ndarray) -> int:
+    """Total cards after copies, as a running sum over a difference array.
+
+    Each card's copies depend on the ones before it, so this one pass stays
+    a loop, over plain ints since the totals outgrow int64 on big decks.
+    """
+    n_cards = len(matches)
+    stops = np.minimum(np.arange(n_cards) + 1 + matches, n_cards).tolist()
+    delta = [0] * (n_cards + 1)
+    won, total = 0, 0
+    for i, stop in enumerate(stops):
+        won += delta[i]
+        copies = 1 + won
+        total += copies
+        # This card's copies go to every card in [i + 1, stop).
+        delta[i + 1] += copies
+        delta[stop] -= copies
+    return total
+
+
+# --- Benchmark hooks ---
+def prepare(data: str) -> List[Card]:
+    return [parse_line(line.strip()) for line in data.split('\n')]
+
+def part1(cards: List[Card]) -> int:
+    return sum(card.points for card in cards)
 
+def part2(cards: List[Card]) -> int:
+    return sum(c.copies for c in propagate_copies(cards))
 
 
 if __name__ == '__main__':
-    data: List[str] = [
-        line.strip()
-        for line in get_data(day=4, year=2023).split('\n')
-    ]
-    cards = [parse_line(line) for line in data]
+    cards = prepare(get_data(day=4, year=2023))
     # Part 1.
-    print(f"The total points across all cards is: {sum(card.points for card in cards)}")
+    print(f"The total points across all cards is: {part1(cards)}")
     # Part 2:
-    cards = reduce_cards(cards)
-    print(f"The reduced card score is: {sum(c.copies for c in cards)}")
\ No newline at end of file
+    print(f"The reduced card score is: {part2(cards)}")
@@ -1,7 +1,11 @@
-from aocd import get_data
-from dataclasses import dataclass
+from inputs import get_data
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict
+import numpy as np
+import sys
+import time
+from typing import List, Dict, Self, Iterable, Iterator
 
 Seed = int
 
@@ -28,26 +32,135 @@ class Map:
     source: str
     target: str
     segments: List[Segment]
+    # Source starts of the sorted segments. Call sort() again after editing
+    # the segments, parse does once it has read them all.
+    starts: List[int] = field(default_factory=list, repr=False)
+
+    def __post_init__(self):
+        self.sort()
+
+    def sort(self) -> Self:
+        self.segments.sort(key=lambda s: s.source_start)
+        self.starts = [s.source_start for s in self.segments]
+        return self
 
     def eval(self, x: int) -> int:
-        for s in self.segments:
-            maybe = s.eval(x)
-            if maybe: return maybe
+        # Segments never overlap, so only the last one starting at or
+        # before x can hold it.
+        i = bisect_right(self.starts, x) - 1
+        if i >= 0:
+            maybe = self.segments[i].eval(x)
+            if maybe is not None: return maybe
         return x
 
-    def eval_range(self, r: range) -> List[range]:
-        queue: List[range] = [r]
-        output: List[range] = []
-        for segment in self.segments:
-            nqueue = []
-            for r in queue:
-                nqueue.append(left_difference(r, segment.range))
-                nqueue.append(right_difference(r, segment.range))
-                i = intersect(r, segment.range)
-                if i:
-                    output.append(segment.eval_range(i))
-            queue = [r for r in nqueue if r is not None]
-        return output + queue
+    def eval_batch(self, xs: np.ndarray) -> np.ndarray:
+        """eval over a whole int64 array of values at once."""
+        if not self.segments:
+            return xs
+        starts = np.array(self.starts, dtype=np.int64)
+        stops = np.array([s.range.stop for s in self.segments], dtype=np.int64)
+        offsets = np.array(
+            [s.destination_start - s.source_start for s in self.segments], dtype=np.int64
+        )
+        i = np.searchsorted(starts, xs, side='right') - 1
+        # i == -1 wraps around to the last segment, but is masked out anyway.
+        inside = (i >= 0) & (xs < stops[i])
+        return xs + np.where(inside, offsets[i], 0)
+
+    def piecewise(self) -> "Piecewise":
+        starts, offsets = [], []
+        position = 0
+        for s in self.segments:
+            if s.source_start > position:
+                starts.append(position)
+                offsets.append(0)
+            starts.append(s.source_start)
+            offsets.append(s.destination_start - s.source_start)
+            position = s.range.stop
+        starts.append(position)
+        offsets.append(0)
+        return Piecewise(starts, offsets).coalesce()
+
+    def sweep(self, rs: "RangeSet") -> Iterator[range]:
+        """The images of a set of ranges, in one pass over both sorted lists.
+
+        The ranges are disjoint and sorted, so a segment that ends before
+        one range starts also ends before every later one, and is never
+        looked at again.
+        """
+        j = 0
+        for r in rs:
+            while j < len(self.segments) and self.segments[j].range.stop <= r.start:
+                j += 1
+            rest, k = r, j
+            while rest and k < len(self.segments) and self.segments[k].range.start < rest.stop:
+                segment = self.segments[k]
+                if left := left_difference(rest, segment.range):
+                    yield left
+                if i := intersect(rest, segment.range):
+                    yield segment.eval_range(i)
+                rest = right_difference(rest, segment.range)
+                k += 1
+            if rest:
+                yield rest
+
+    def eval_range(self, rs: "RangeSet | range") -> "RangeSet":
+        if isinstance(rs, range):
+            rs = RangeSet([rs])
+        return RangeSet(self.sweep(rs))
+
+
+@dataclass
+class Piecewise:
+    """x -> x + offsets[i] for starts[i] <= x < starts[i + 1], on x >= 0.
+
+    Every map is one of these, and so is any chain of maps, so the whole
+    atlas can be folded into one before any seed is looked up.
+    """
+    starts: List[int]
+    offsets: List[int]
+
+    def __call__(self, x: int) -> int:
+        return x + self.offsets[bisect_right(self.starts, x) - 1]
+
+    def coalesce(self) -> Self:
+        starts, offsets = [], []
+        for s, o in zip(self.starts, self.offsets):
+            if offsets and offsets[-1] == o:
+                continue
+            if starts and starts[-1] == s:
+                starts.pop()
+                offsets.pop()
+            starts.append(s)
+            offsets.append(o)
+        return Piecewise(starts, offsets)
+
+    def then(self, other: "Piecewise") -> "Piecewise":
+        """This function followed by other, i.e. other(self(x))."""
+        starts, offsets = [], []
+        for i, (lo, offset) in enumerate(zip(self.starts, self.offsets)):
+            hi = self.starts[i + 1] if i + 1 < len(self.starts) else None
+            # Cut this piece wherever its image crosses one of other's starts.
+            j = max(bisect_right(other.starts, lo + offset) - 1, 0)
+            while True:
+                starts.append(lo)
+                offsets.append(offset + other.offsets[j])
+                if j + 1 == len(other.starts):
+                    break
+                lo = other.starts[j + 1] - offset
+                if hi is not None and lo >= hi:
+                    break
+                j += 1
+        return Piecewise(starts, offsets).coalesce()
+
+def compose_atlas(atlas: Dict[str, Map]) -> Piecewise:
+    """The seed -> location function, as a single piecewise linear map."""
+    map = atlas['seed']
+    composed = map.piecewise()
+    while map.target in atlas:
+        map = atlas[map.target]
+        composed = composed.then(map.piecewise())
+    return composed
 
 
 # -- range API functions ---
@@ -69,6 +182,35 @@ def right_difference(r0: range, r1: range) -> range | None:
     return None
 
 
+class RangeSet:
+    """A set of integers, as sorted ranges that neither overlap nor touch."""
+
+    def __init__(self, ranges: Iterable[range] = ()):
+        self.ranges: List[range] = []
+        for r in sorted((r for r in ranges if r), key=lambda r: r.start):
+            last = self.ranges[-1] if self.ranges else None
+            if last is not None and r.start <= last.stop:
+                self.ranges[-1] = range(last.start, max(last.stop, r.stop))
+            else:
+                self.ranges.append(r)
+
+    def __repr__(self) -> str:
+        return f"RangeSet({self.ranges})"
+
+    def __iter__(self) -> Iterator[range]:
+        return iter(self.ranges)
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    def __bool__(self) -> bool:
+        return bool(self.ranges)
+
+    @property
+    def min(self) -> int:
+        return self.ranges[0].start
+
+
 # --- Parsing ---
 class ParseStates(Enum):
     SEEDS = 0
@@ -94,7 +236,7 @@ def parse(data: List[str]) -> (List[Seed], List[Map]):
                 state = ParseStates.SEGMENT
             case ParseStates.SEGMENT:
                 maps[-1].segments.append(parse_segment_line(line))
-    return seeds, maps
+    return seeds, [m.sort() for m in maps]
 
 def parse_seeds_line(line: str) -> List[int]:
     _, seedstr = line.split(':')
@@ -126,37 +268,91 @@ def evaluate_seed(seed: Seed, atlas: Dict[str, Map]) -> int:
         map = atlas[target]
         target = map.target
 
-def evaluate_seed_range(seedrange: range, atlas: Dict[str, Map]) -> int:
+def evaluate_seeds(seeds: np.ndarray, atlas: Dict[str, Map]) -> np.ndarray:
+    map = atlas['seed']
+    xs = np.asarray(seeds, dtype=np.int64)
+    while True:
+        xs = map.eval_batch(xs)
+        if map.target == 'location':
+            return xs
+        map = atlas[map.target]
+
+def batch_speedup(almanac: (List[Seed], Dict[str, Map]), n: int, seed: int = 2023) -> Dict[str, float]:
+    """Time evaluate_seeds against evaluate_seed on n seeds drawn from the
+    part 2 seed ranges."""
+    seeds, atlas = almanac
+    ranges = to_seed_ranges(seeds)
+    rng = np.random.default_rng(seed)
+    lengths = np.array([len(r) for r in ranges], dtype=np.int64)
+    which = rng.choice(len(ranges), size=n, p=lengths / lengths.sum())
+    starts = np.array([r.start for r in ranges], dtype=np.int64)
+    sample = starts[which] + (rng.random(n) * lengths[which]).astype(np.int64)
+
+    t = time.perf_counter()
+    batch = evaluate_seeds(sample, atlas)
+    batch_time = time.perf_counter() - t
+    t = time.perf_counter()
+    scalar = [evaluate_seed(x, atlas) for x in sample.tolist()]
+    scalar_time = time.perf_counter() - t
+    assert batch.tolist() == scalar
+    return {
+        "scalar": scalar_time,
+        "batch": batch_time,
+        "speedup": scalar_time / batch_time,
+    }
+
+def evaluate_seed_range(seedrange: range | RangeSet, atlas: Dict[str, Map]) -> RangeSet:
     map = atlas['seed']
     target = map.target
-    xs: List[range] = [seedrange]
+    xs = seedrange if isinstance(seedrange, RangeSet) else RangeSet([seedrange])
     while target:
         if target == 'location':
-            return sum([map.eval_range(x) for x in xs], [])
-        xs = sum([map.eval_range(x) for x in xs], [])
+            return map.eval_range(xs)
+        xs = map.eval_range(xs)
         map = atlas[target]
         target = map.target
 
+def minimum_location(seedranges: RangeSet, atlas: Dict[str, Map]) -> int:
+    """Push the seeds through every map but the last, then only keep the
+    smallest start coming out of it, rather than the whole location set."""
+    map = atlas['seed']
+    xs = seedranges
+    while map.target != 'location':
+        xs = map.eval_range(xs)
+        map = atlas[map.target]
+    return min(r.start for r in map.sweep(xs))
 
-if __name__ == '__main__':
-    data: List[str] = [
-        line.strip()
-        for line in get_data(day=5, year=2023).split('\n')
-    ]
-    seeds, maps = parse(data)
+# --- Benchmark hooks ---
+def prepare(data: str) -> (List[Seed], Dict[str, Map]):
+    seeds, maps = parse([line.strip() for line in data.split('\n')])
     atlas: Dict[str, Map] = {
         map.source: map for map in maps
     }
+    return seeds, atlas
+
+def part1(almanac: (List[Seed], Dict[str, Map])) -> int:
+    seeds, atlas = almanac
+    location = compose_atlas(atlas)
+    return min(location(seed) for seed in seeds)
 
-    locations = []
-    for seed in seeds:
-        locations.append(evaluate_seed(seed, atlas))
-    print(f"The minimum location number is: {min(locations)}")
+def part2(almanac: (List[Seed], Dict[str, Map])) -> int:
+    seeds, atlas = almanac
+    return minimum_location(RangeSet(to_seed_ranges(seeds)), atlas)
+
+
+if __name__ == '__main__':
+    almanac = prepare(get_data(day=5, year=2023))
+
+    # python -m day5.solution --speedup 10000000 times the batch evaluation
+    # against the scalar one on that many seeds sampled from the seed ranges.
+    if sys.argv[1:2] == ['--speedup']:
+        r = batch_speedup(almanac, int(sys.argv[2]))
+        print(
+            f"scalar {r['scalar']:.3f}s, batch {r['batch']:.3f}s,"
+            f" speedup {r['speedup']:.1f}x"
+        )
+        sys.exit()
 
-    location_ranges = []
-    seed_ranges = to_seed_ranges(seeds)
-    for srng in seed_ranges:
-        location_ranges.append(evaluate_seed_range(srng, atlas))
+    print(f"The minimum location number is: {part1(almanac)}")
 
-    location_ranges = sum(location_ranges, [])
-    print(f"The minimum location number is: {min(r.start for r in location_ranges)}")
+    print(f"The minimum location number is: {part2(almanac)}")
@@ -1,8 +1,12 @@
-from aocd import get_data
+from inputs import get_data
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Dict
-from math import sqrt, ceil, floor, prod
+from typing import List, Dict, Tuple, Sequence
+from math import isqrt, prod
+import numpy as np
+
+# Below this T*T and 4*D both fit in an int64 with room to spare.
+INT64_LIMIT = 2**31
 
 @dataclass
 class Race:
@@ -11,19 +15,93 @@ class Race:
 
     @property
     def support(self) -> (int, int):
-        dicrim = sqrt(self.time*self.time - 4*self.distance)
-        return(
-            floor((self.time - dicrim)/2 + 1),
-            ceil((self.time + dicrim)/2 - 1),
+        # Holding for h wins when h * (time - h) > distance, which is
+        # symmetric about time / 2, so only the low end needs finding. A
+        # race that cannot be won comes back empty, with low > high.
+        low = first_win(self.time, self.distance)
+        return low, self.time - low
+
+
+def first_win(time: int, distance: int) -> int:
+    """The shortest winning hold, or past time / 2 if there is none.
+
+    Exact for any size of int, where a float square root is not past 2**53.
+    """
+    discrim = time*time - 4*distance
+    if discrim < 0:
+        return time // 2 + 1
+    low = (time - isqrt(discrim)) // 2
+    while low * (time - low) <= distance and 2 * low <= time:
+        low += 1
+    return low
+
+def win_counts(times: Sequence[int], distances: Sequence[int]) -> np.ndarray:
+    """The number of winning holds for each (time, distance) pair.
+
+    int64 arrays when every race is small enough, otherwise an object array
+    of exact Python ints.
+    """
+    if fits_int64(times, INT64_LIMIT) and fits_int64(distances, INT64_LIMIT**2 // 4):
+        return _win_counts_int64(
+            np.asarray(times, dtype=np.int64), np.asarray(distances, dtype=np.int64)
         )
+    counts = []
+    for t, d in zip(times, distances):
+        counts.append(max(t - 2 * first_win(t, d) + 1, 0))
+    return np.array(counts, dtype=object)
+
+def fits_int64(xs: Sequence[int], limit: int) -> bool:
+    if isinstance(xs, np.ndarray) and xs.dtype.kind in 'iu':
+        return xs.size == 0 or (xs.min() >= 0 and xs.max() < limit)
+    return all(0 <= x < limit for x in xs)
+
+def _win_counts_int64(times: np.ndarray, distances: np.ndarray) -> np.ndarray:
+    discrim = times * times - 4 * distances
+    root = np.sqrt(np.maximum(discrim, 0).astype(np.float64)).astype(np.int64)
+    # The float root can be off by one either way, nudge it to isqrt.
+    root -= root * root > discrim
+    root += (root + 1) * (root + 1) <= discrim
+    low = (times - root) // 2
+    for _ in range(2):
+        low += low * (times - low) <= distances
+    counts = np.maximum(times - 2 * low + 1, 0)
+    return np.where(discrim < 0, 0, counts)
+
+def solve_races(times: Sequence[int], distances: Sequence[int]) -> Tuple[int, np.ndarray]:
+    """The product of the win counts, exactly, and the counts themselves."""
+    counts = win_counts(times, distances)
+    if not np.all(counts):
+        return 0, counts
+    # Multiply in pairs, a running product over millions of counts spends
+    # all its time on one huge int.
+    factors = [int(c) for c in counts]
+    while len(factors) > 1:
+        factors = [prod(factors[i:i + 2]) for i in range(0, len(factors), 2)]
+    return (factors[0] if factors else 1), counts
+
+# --- Benchmark hooks ---
+def prepare(data: str) -> List[Race]:
+    timestr, distancestr = data.strip().split('\n')
+    times = [int(x) for x in timestr.split(':')[1].split()]
+    distances = [int(x) for x in distancestr.split(':')[1].split()]
+    return [Race(t, d) for t, d in zip(times, distances)]
+
+def part1(races: List[Race]) -> int:
+    product, _ = solve_races([r.time for r in races], [r.distance for r in races])
+    return product
+
+def part2(races: List[Race]) -> int:
+    # The kerning was a lie, it is really one long race.
+    race = Race(
+        int(''.join(str(r.time) for r in races)),
+        int(''.join(str(r.distance) for r in races)),
+    )
+    return int(win_counts([race.time], [race.distance])[0])
+
 
 if __name__ == '__main__':
-    RACES = [Race(54, 446), Race(81, 1292), Race(70, 1035), Race(88, 1007)]
-    RACE = Race(54817088, 446129210351007)
+    races: List[Race] = prepare(get_data(day=6, year=2023))
 
-    supports = [r.support for r in RACES]
-    sol = prod(x[1] - x[0] + 1 for x in supports)
-    print(f"The product is: {sol}")
+    print(f"The product is: {part1(races)}")
 
-    support = RACE.support
-    print(f"The number of ways to win is: {support[1] - support[0] + 1}")
\ No newline at end of file
+    print(f"The number of ways to win is: {part2(races)}")
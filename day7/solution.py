@@ -1,15 +1,16 @@
-from aocd import get_data
+from inputs import get_data
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Dict, Self
+from typing import List, Dict, Set, Tuple, Self
 from collections import Counter
 from functools import total_ordering
+from itertools import combinations
+import numpy as np
 
 CARD_VALUES = (
     {c: int(c) for c in '23456789'}
     | {'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
 )
-NON_JOKERS = "23456789TQKA"
 JOKER_CARD_VALUES = (
     {c: v for c, v in CARD_VALUES.items() if c != 'J'}
     | {'J': 1}
@@ -28,6 +29,42 @@ class HandRank(Enum):
     def __lt__(self, other: Self) -> bool:
         return self.value < other.value
 
+# The card counts of a hand, largest first, decide its rank.
+Signature = Tuple[int, ...]
+SIGNATURE_RANKS: Dict[Signature, HandRank] = {
+    (5,): HandRank.FIVE_OF_A_KIND,
+    (4, 1): HandRank.FOUR_OF_A_KIND,
+    (3, 2): HandRank.FULL_HOUSE,
+    (3, 1, 1): HandRank.THREE_OF_A_KIND,
+    (2, 2, 1): HandRank.TWO_PAIR,
+    (2, 1, 1, 1): HandRank.ONE_PAIR,
+    (1, 1, 1, 1, 1): HandRank.HIGH_CARD,
+}
+
+def signature(histogram: Counter) -> Signature:
+    return tuple(sorted(histogram.values(), reverse=True))
+
+def joker_signature(histogram: Counter) -> Signature:
+    """The best signature once the jokers are swapped for other cards.
+
+    That is always all the jokers joining the most common other card.
+    """
+    jokers = histogram.get('J', 0)
+    counts = sorted((n for c, n in histogram.items() if c != 'J'), reverse=True)
+    if not counts:
+        return (jokers,)
+    return (counts[0] + jokers, *counts[1:])
+
+# Every packed key is below this: three bits of rank, then five nibbles.
+KEY_SPACE = 1 << 23
+
+def pack(rank: HandRank, cards: str, values: Dict[str, int]) -> int:
+    """A sort key for a hand: the rank, then each card in a nibble."""
+    key = rank.value
+    for c in cards:
+        key = (key << 4) | values[c]
+    return key
+
 
 @total_ordering
 class Hand:
@@ -35,6 +72,7 @@ class Hand:
         self.cards = cards.strip()
         self.histogram = Counter(self.cards)
         self.rank = self._rank()
+        self.key = pack(self.rank, self.cards, CARD_VALUES)
         self.score = int(score)
 
     def __repr__(self) -> str:
@@ -44,40 +82,20 @@ class Hand:
         return self.cards == other.cards
 
     def __lt__(self, other: Self) -> bool:
-        if self.rank != other.rank:
-            return self.rank < other.rank
-        for mine, theirs in zip(self.cards, other.cards):
-            if mine != theirs:
-                return CARD_VALUES[mine] < CARD_VALUES[theirs]
-        raise ValueError(f"{self} and {other} are the same hand.")
+        if self.key == other.key:
+            raise ValueError(f"{self} and {other} are the same hand.")
+        return self.key < other.key
 
     def _rank(self) -> HandRank:
-        (argmax, themax), *_ =  self.histogram.most_common()
-        counts = set(self.histogram.values())
-        countscounts = Counter(self.histogram.values())
-        if themax == 5:
-            return HandRank.FIVE_OF_A_KIND
-        if themax == 4:
-            return HandRank.FOUR_OF_A_KIND
-        if counts == {3, 2}:
-            return HandRank.FULL_HOUSE
-        if themax == 3:
-            return HandRank.THREE_OF_A_KIND
-        if countscounts[2] == 2:
-            return HandRank.TWO_PAIR
-        if countscounts[2] == 1:
-            return HandRank.ONE_PAIR
-        return HandRank.HIGH_CARD
+        return SIGNATURE_RANKS[signature(self.histogram)]
 
 @total_ordering
 class JokerHand:
     def __init__(self, cards: str, score: int):
         self.cards = cards.strip()
-        self.hands = [
-            Hand(cards=cards.replace('J', r), score=score)
-            for r in NON_JOKERS
-        ]
-        self.rank = max(h.rank for h in self.hands)
+        self.histogram = Counter(self.cards)
+        self.rank = SIGNATURE_RANKS[joker_signature(self.histogram)]
+        self.key = pack(self.rank, self.cards, JOKER_CARD_VALUES)
         self.score = int(score)
 
     def __repr__(self) -> str:
@@ -87,12 +105,142 @@ class JokerHand:
         return self.cards == other.cards
 
     def __lt__(self, other: Self) -> bool:
-        if self.rank != other.rank:
-            return self.rank < other.rank
-        for mine, theirs in zip(self.cards, other.cards):
-            if mine != theirs:
-                return JOKER_CARD_VALUES[mine] < JOKER_CARD_VALUES[theirs]
-        raise ValueError(f"{self} and {other} are the same hand.")
+        if self.key == other.key:
+            raise ValueError(f"{self} and {other} are the same hand.")
+        return self.key < other.key
+
+
+class Fenwick:
+    """Prefix sums over 0 <= i < size, with point updates, both O(log size).
+
+    Nodes live in a dict, so a huge index space costs nothing until used.
+    """
+    def __init__(self, size: int):
+        self.size = size
+        self.tree: Dict[int, int] = {}
+
+    def add(self, i: int, delta: int):
+        i += 1
+        while i <= self.size:
+            self.tree[i] = self.tree.get(i, 0) + delta
+            i += i & -i
+
+    def prefix(self, i: int) -> int:
+        """The sum over [0, i)."""
+        total = 0
+        while i > 0:
+            total += self.tree.get(i, 0)
+            i -= i & -i
+        return total
+
+
+class Ledger:
+    """Total winnings of a game that hands join one at a time.
+
+    A new hand takes the rank one above every weaker hand, and every
+    stronger hand moves up a rank, which adds its bid once more. Both come
+    from Fenwick trees over the packed keys, so each arrival is O(log n)
+    rather than a re-sort. Hands should all be Hand or all be JokerHand.
+    """
+    def __init__(self):
+        self.counts = Fenwick(KEY_SPACE)
+        self.bids = Fenwick(KEY_SPACE)
+        self.keys: Set[int] = set()
+        self.bid_total = 0
+        self.total = 0
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, hand: "Hand | JokerHand") -> int:
+        if hand.key in self.keys:
+            raise ValueError(f"{hand} is already in the game.")
+        rank = self.counts.prefix(hand.key) + 1
+        stronger = self.bid_total - self.bids.prefix(hand.key + 1)
+        self.total += rank * hand.score + stronger
+        self.keys.add(hand.key)
+        self.counts.add(hand.key, 1)
+        self.bids.add(hand.key, hand.score)
+        self.bid_total += hand.score
+        return self.total
+
+
+@dataclass
+class Game:
+    """Every hand in a game as arrays: the card characters, one row of five
+    per hand, and the bids."""
+    cards: np.ndarray
+    bids: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.bids)
+
+def parse_game(data: str) -> Game:
+    words = data.split()
+    cards = np.frombuffer(''.join(words[0::2]).encode(), dtype=np.uint8)
+    return Game(cards.reshape(-1, 5), np.array(words[1::2], dtype=np.int64))
+
+def card_table(values: Dict[str, int]) -> np.ndarray:
+    table = np.zeros(256, dtype=np.int64)
+    for c, v in values.items():
+        table[ord(c)] = v
+    return table
+
+CARD_TABLE = card_table(CARD_VALUES)
+JOKER_CARD_TABLE = card_table(JOKER_CARD_VALUES)
+
+def partitions(n: int, largest: int | None = None) -> List[Signature]:
+    largest = n if largest is None else largest
+    if n == 0:
+        return [()]
+    return [
+        (first, *rest)
+        for first in range(min(n, largest), 0, -1)
+        for rest in partitions(n - first, first)
+    ]
+
+def rank_table(jokers: bool) -> np.ndarray:
+    """HandRank values, indexed by the number of jokers and then the number
+    of equal pairs among the other cards.
+
+    The pair count, sum(n * (n - 1) / 2), tells every signature of a given
+    size apart, so the two together pin down the rank.
+    """
+    table = np.zeros((6, 11), dtype=np.int64)
+    for k in range(6 if jokers else 1):
+        for sig in partitions(5 - k):
+            histogram = Counter(dict(zip('AKQT9', sig))) + Counter({'J': k})
+            pairs = sum(n * (n - 1) // 2 for n in sig)
+            rank = joker_signature(histogram) if jokers else signature(histogram)
+            table[k, pairs] = SIGNATURE_RANKS[rank].value
+    return table
+
+RANK_TABLE = rank_table(jokers=False)
+JOKER_RANK_TABLE = rank_table(jokers=True)
+
+def hand_ranks(cards: np.ndarray, jokers: bool = False) -> np.ndarray:
+    pairs = np.zeros(len(cards), dtype=np.int64)
+    if not jokers:
+        for i, j in combinations(range(5), 2):
+            pairs += cards[:, i] == cards[:, j]
+        return RANK_TABLE[0, pairs]
+    is_joker = cards == ord('J')
+    for i, j in combinations(range(5), 2):
+        pairs += (cards[:, i] == cards[:, j]) & ~is_joker[:, i]
+    return JOKER_RANK_TABLE[is_joker.sum(axis=1), pairs]
+
+def hand_keys(cards: np.ndarray, jokers: bool = False) -> np.ndarray:
+    """The same packed keys as Hand.key or JokerHand.key, for every hand."""
+    keys = hand_ranks(cards, jokers)
+    values = (JOKER_CARD_TABLE if jokers else CARD_TABLE)[cards]
+    for i in range(5):
+        keys = (keys << 4) | values[:, i]
+    return keys
+
+def total_winnings(game: Game, jokers: bool = False) -> int:
+    order = np.argsort(hand_keys(game.cards, jokers), kind='stable')
+    ranks = np.arange(1, len(game) + 1, dtype=np.int64)
+    return int(game.bids[order] @ ranks)
 
 
 def parse_line_into_hand(line: str) -> Hand:
@@ -103,25 +251,22 @@ def parse_line_into_joker_hand(line: str) -> Hand:
     cards, score = line.split()
     return JokerHand(cards=cards, score=score)
 
+# --- Benchmark hooks ---
+def prepare(data: str) -> Game:
+    return parse_game(data)
+
+def part1(game: Game) -> int:
+    return total_winnings(game)
+
+def part2(game: Game) -> int:
+    return total_winnings(game, jokers=True)
+
 
 if __name__ == '__main__':
-    data: List[str] = [
-        line.strip()
-        for line in get_data(day=7, year=2023).split('\n')
-    ]
+    game: Game = prepare(get_data(day=7, year=2023))
 
     # Part 1.
-    hands: List[Hand] = [parse_line_into_hand(line) for line in data]
-    hands = sorted(hands)
-    score = sum(
-        rank*hand.score for rank, hand in  enumerate(hands, start=1)
-    )
-    print(f"Your total score is: {score}")
+    print(f"Your total score is: {part1(game)}")
 
     # Part 2.
-    hands: List[JokerHand] = [parse_line_into_joker_hand(line) for line in data]
-    hands = sorted(hands)
-    score = sum(
-        rank*hand.score for rank, hand in  enumerate(hands, start=1)
-    )
-    print(f"Your total score is: {score}")
\ No newline at end of file
+    print(f"Your total score is: {part2(game)}")
@@ -1,8 +1,11 @@
-from aocd import get_data
+from inputs import get_data
 from dataclasses import dataclass
-from typing import List, Dict, Iterable
+from typing import List, Dict, Iterable, Callable, Tuple
 from itertools import cycle
-from math import lcm
+from math import gcd, lcm
+import numpy as np
+import sys
+import time
 
 @dataclass(frozen=True)
 class Node:
@@ -38,23 +41,260 @@ def walktill(frm: str, instructions: Iterable[str], tbl: NodeTable) -> int:
     return i
 
 
+@dataclass
+class Graph:
+    """The node table compiled to integer ids, node i going to
+    children[i, 0] on L and children[i, 1] on R."""
+    names: List[str]
+    ids: Dict[str, int]
+    children: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def mask(self, predicate: Callable[[str], bool]) -> np.ndarray:
+        return np.array([predicate(name) for name in self.names], dtype=bool)
+
+def compile_graph(tbl: NodeTable) -> Graph:
+    names = list(tbl)
+    ids = {name: i for i, name in enumerate(names)}
+    children = np.array(
+        [[ids[c] for c in tbl[name].children] for name in names], dtype=np.int64
+    ).reshape(-1, 2)
+    return Graph(names, ids, children)
+
+def compile_directions(directions: str) -> np.ndarray:
+    return np.array(['LR'.index(d) for d in directions], dtype=np.int64)
+
+
+class JumpTable:
+    """Binary lifting over whole passes through the instructions.
+
+    jumps[k][v] is where 2**k passes starting at v end up, and hits[k][v]
+    says whether a target is landed on along the way. first[v] is the step
+    of the first target hit in a single pass from v, if any.
+    """
+    def __init__(self, graph: Graph, directions: np.ndarray, targets: np.ndarray):
+        self.graph = graph
+        self.directions = directions
+        self.targets = targets
+        self.period = len(directions)
+        # The first target hit of one pass from every node at once.
+        n = len(graph)
+        position = np.arange(n)
+        self.first = np.zeros(n, dtype=np.int64)
+        for step, d in enumerate(directions, start=1):
+            position = graph.children[position, d]
+            self.first[(self.first == 0) & targets[position]] = step
+        self.jumps = [position]
+        self.hits = [self.first > 0]
+        # Within n passes the pass ends have run through their whole cycle.
+        self.grow(n.bit_length() + 1)
+
+    def grow(self, levels: int):
+        while len(self.jumps) < levels:
+            jump, hit = self.jumps[-1], self.hits[-1]
+            self.jumps.append(jump[jump])
+            self.hits.append(hit | hit[jump])
+
+    def position(self, start: int, steps: int) -> int:
+        """The node reached after some number of steps.
+
+        Whole passes take O(log steps), the remainder is walked directly.
+        """
+        passes, rest = divmod(steps, self.period)
+        self.grow(passes.bit_length())
+        v = start
+        for k in range(passes.bit_length()):
+            if passes >> k & 1:
+                v = self.jumps[k][v]
+        for d in self.directions[:rest]:
+            v = self.graph.children[v, d]
+        return int(v)
+
+    def first_hit(self, start: int) -> int | None:
+        """The number of steps until the first target, or None if the walk
+        from start never lands on one."""
+        if not self.hits[-1][start]:
+            return None
+        v, passes = start, 0
+        for k in reversed(range(len(self.jumps))):
+            if not self.hits[k][v]:
+                v = self.jumps[k][v]
+                passes += 1 << k
+        return passes * self.period + int(self.first[v])
+
+
+@dataclass
+class Trajectory:
+    """Where a ghost lands on targets: at the steps in tail_hits, and then
+    at every step t >= tail with t % period in cycle_hits."""
+    tail: int
+    period: int
+    tail_hits: List[int]
+    cycle_hits: List[int]
+
+    def hits(self, t: int) -> bool:
+        if t < self.tail:
+            return t in self.tail_hits
+        return t % self.period in self.cycle_hits
+
+def trajectory(table: JumpTable, start: int) -> Trajectory:
+    """Split a walk into a tail and a cycle of (node, instruction) states.
+
+    The instruction index is back at zero after every pass, so the states
+    at pass ends cycle exactly when the nodes there do, which the pass map
+    finds in at most n passes. The tail is rounded up to whole passes, and
+    is at least one so that step 0 never counts as a hit.
+    """
+    seen: Dict[int, int] = {}
+    v, passes = start, 0
+    while v not in seen:
+        seen[v] = passes
+        v = int(table.jumps[0][v])
+        passes += 1
+    tail = max(seen[v], 1) * table.period
+    period = (passes - seen[v]) * table.period
+
+    children = table.graph.children.tolist()
+    directions = table.directions.tolist()
+    targets = table.targets.tolist()
+    tail_hits, cycle_hits = [], []
+    v = start
+    for t in range(1, tail + period + 1):
+        v = children[v][directions[(t - 1) % table.period]]
+        if targets[v]:
+            if t < tail:
+                tail_hits.append(t)
+            elif t < tail + period:
+                cycle_hits.append(t % period)
+    return Trajectory(tail, period, tail_hits, sorted(set(cycle_hits)))
+
+def crt(a: int, m: int, b: int, n: int) -> Tuple[int, int] | None:
+    """The x mod lcm(m, n) with x = a mod m and x = b mod n, if there is one."""
+    g = gcd(m, n)
+    if (b - a) % g:
+        return None
+    k = ((b - a) // g * pow(m // g, -1, n // g)) % (n // g)
+    l = m // g * n
+    return (a + m * k) % l, l
+
+def merge(a: List[int], m: int, b: List[int], n: int) -> Tuple[List[int], int]:
+    """Combine two sets of allowed residues into one set mod lcm(m, n)."""
+    merged = set()
+    for x in a:
+        for y in b:
+            if (solution := crt(x, m, y, n)) is not None:
+                merged.add(solution[0])
+    return sorted(merged), lcm(m, n)
+
+def earliest_common(trajectories: List[Trajectory]) -> int | None:
+    """The first step at which every ghost is on a target at once."""
+    longest = max(trajectories, key=lambda tr: tr.tail)
+    # Anything before the longest tail is one of that ghost's tail hits.
+    for t in longest.tail_hits:
+        if all(tr.hits(t) for tr in trajectories):
+            return t
+    residues, modulus = [0], 1
+    for tr in trajectories:
+        residues, modulus = merge(residues, modulus, tr.cycle_hits, tr.period)
+        if not residues:
+            return None
+    # Past every tail, so only the residues matter.
+    start = longest.tail
+    return min(r + -(-(start - r) // modulus) * modulus for r in residues)
+
+
+def lockstep_first_hits(
+    graph: Graph, directions: np.ndarray, targets: np.ndarray,
+    starts: np.ndarray, max_steps: int | None = None,
+) -> np.ndarray:
+    """Walk every ghost together, one instruction at a time, and return the
+    step of each one's first target, or 0 if it has none by max_steps.
+
+    By default that is n * len(directions) steps, after which every
+    (node, instruction) state has repeated, so a ghost still at 0 never
+    reaches a target at all.
+    """
+    if max_steps is None:
+        max_steps = len(graph) * len(directions)
+    positions = np.asarray(starts, dtype=np.int64)
+    first = np.zeros(len(positions), dtype=np.int64)
+    step = 0
+    for d in cycle(directions):
+        if first.all() or step == max_steps:
+            break
+        step += 1
+        positions = graph.children[positions, d]
+        first[(first == 0) & targets[positions]] = step
+    return first
+
+def lockstep_speedup(puzzle: (str, NodeTable)) -> Dict[str, float]:
+    """Ghost-steps per second, walking ghosts together and then one at a
+    time with walktill.
+
+    A puzzle only has a handful of ..A starts, too few for lockstep to
+    show its throughput, so a ghost starts from every node instead. Nodes
+    that never reach a Z node are left out, since walktill from them would
+    never return.
+    """
+    directions, nodetable = puzzle
+    graph = compile_graph(nodetable)
+    targets = graph.mask(lambda name: name.endswith('Z'))
+    table = JumpTable(graph, compile_directions(directions), targets)
+    starts = np.flatnonzero(table.hits[-1])
+
+    t = time.perf_counter()
+    first = lockstep_first_hits(graph, table.directions, targets, starts)
+    lockstep_time = time.perf_counter() - t
+    t = time.perf_counter()
+    scalar = [walktill(graph.names[v], cycle(directions), nodetable) for v in starts]
+    scalar_time = time.perf_counter() - t
+    assert first.tolist() == scalar
+    # Lockstep keeps stepping finished ghosts until the slowest one is done.
+    lockstep_steps = len(starts) * int(first.max(initial=0))
+    return {
+        "ghosts": len(starts),
+        "scalar": sum(scalar) / scalar_time,
+        "lockstep": lockstep_steps / lockstep_time,
+        "speedup": scalar_time / lockstep_time,
+    }
+
+
+# --- Benchmark hooks ---
+def prepare(data: str) -> (str, NodeTable):
+    lines: List[str] = [line.strip() for line in data.split('\n')]
+    nodes = [parse_node_line(line) for line in lines[2:]]
+    return lines[0], {n.name: n for n in nodes}
+
+def part1(puzzle: (str, NodeTable)) -> int:
+    directions, nodetable = puzzle
+    graph = compile_graph(nodetable)
+    table = JumpTable(graph, compile_directions(directions), graph.mask(lambda name: name == 'ZZZ'))
+    return table.first_hit(graph.ids['AAA'])
+
+def part2(puzzle: (str, NodeTable)) -> int:
+    directions, nodetable = puzzle
+    graph = compile_graph(nodetable)
+    table = JumpTable(graph, compile_directions(directions), graph.mask(lambda name: name.endswith('Z')))
+    starts = [graph.ids[name] for name in graph.names if name.endswith('A')]
+    return earliest_common([trajectory(table, start) for start in starts])
+
+
 if __name__ == '__main__':
-    data: List[str] = [
-        line.strip()
-        for line in get_data(day=8, year=2023).split('\n')
-    ]
+    puzzle = prepare(get_data(day=8, year=2023))
 
-    nodes = [parse_node_line(line) for line in data[2:]]
-    nodetable: NodeTable = {n.name: n for n in nodes}
+    # python -m day8.solution --speedup walks every ghost in lockstep, then
+    # one at a time, and reports ghost-steps per second for each.
+    if sys.argv[1:2] == ['--speedup']:
+        r = lockstep_speedup(puzzle)
+        print(
+            f"{r['ghosts']} ghosts: scalar {r['scalar']:.3g} ghost-steps/s,"
+            f" lockstep {r['lockstep']:.3g} ghost-steps/s, speedup {r['speedup']:.1f}x"
+        )
+        sys.exit()
 
-    instructions = cycle(data[0])
-    steps = walk('AAA', 'ZZZ', instructions, nodetable)
+    steps = part1(puzzle)
     print(f"It takes {steps} steps to get from AAA to ZZZ")
 
-    starts = [n.name for n in nodes if n.name.endswith('A')]
-    stepcounts: List[int] = []
-    for start in starts:
-        instructions = cycle(data[0])
-        stepcounts.append(walktill(start, instructions, nodetable))
-
-    print(f"It takes {lcm(*stepcounts)} to Z it all out.")
+    print(f"It takes {part2(puzzle)} to Z it all out.")
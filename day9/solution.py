@@ -1,8 +1,10 @@
-from aocd import get_data
+from inputs import get_data
 from dataclasses import dataclass
-from typing import List, Dict, Iterable
+from typing import List, Dict, Iterable, Tuple
 from itertools import cycle
-from math import lcm
+from functools import lru_cache
+from math import comb, lcm
+import numpy as np
 
 class History:
 
@@ -23,18 +25,56 @@ def parse_line(line: str) -> History:
     return History([int(x) for x in line.split(' ')])
 
 
+@lru_cache
+def extrapolation_weights(n: int) -> np.ndarray:
+    """Rows giving the next and the previous value of a length n history.
+
+    Summing the difference pyramid unrolls into binomial coefficients:
+    next = sum (-1)**(n-1-i) C(n, i) x[i], previous = sum (-1)**i C(n, i+1) x[i].
+    """
+    return np.array([
+        [(-1)**(n - 1 - i) * comb(n, i) for i in range(n)],
+        [(-1)**i * comb(n, i + 1) for i in range(n)],
+    ], dtype=object)
+
+def extrapolate(histories: List[List[int]]) -> Tuple[List[int], List[int]]:
+    """The next and previous values of every history, in one matrix product
+    per history length."""
+    by_length: Dict[int, List[int]] = {}
+    for i, h in enumerate(histories):
+        by_length.setdefault(len(h), []).append(i)
+    nexts, previouses = [0] * len(histories), [0] * len(histories)
+    for n, idxs in by_length.items():
+        weights = extrapolation_weights(n)
+        values = [histories[i] for i in idxs]
+        # Each result is bounded by 2**n times the largest value, and the
+        # weights themselves by 2**n.
+        biggest = max((abs(x) for h in values for x in h), default=0)
+        if n <= 62 and max(biggest, 1) << n < 2**63:
+            result = np.array(values, dtype=np.int64) @ weights.astype(np.int64).T
+        else:
+            result = np.array(values, dtype=object).reshape(len(idxs), n) @ weights.T
+        for i, (nxt, prev) in zip(idxs, result.tolist()):
+            nexts[i], previouses[i] = int(nxt), int(prev)
+    return nexts, previouses
+
+# --- Benchmark hooks ---
+def prepare(data: str) -> List[List[int]]:
+    return [[int(x) for x in line.strip().split(' ')] for line in data.split('\n')]
+
+def part1(histories: List[List[int]]) -> int:
+    nexts, _ = extrapolate(histories)
+    return sum(nexts)
+
+def part2(histories: List[List[int]]) -> int:
+    _, previouses = extrapolate(histories)
+    return sum(previouses)
+
+
 if __name__ == '__main__':
-    data: List[str] = [
-        line.strip()
-        for line in get_data(day=9, year=2023).split('\n')
-    ]
-
-    histories = [parse_line(line) for line in data]
-    total = sum(r[-1] for h in histories for r in h.reduction)
-    print(f"The total is {total}")
-
-    totals = []
-    for h in histories:
-        initials = [r[0] for r in h.reduction]
-        totals.append(sum(initials[::2]) - sum(initials[1::2]))
-    print(f"The alternating total is {sum(totals)}")
\ No newline at end of file
+    histories = prepare(get_data(day=9, year=2023))
+    nexts, previouses = extrapolate(histories)
+
+    print(f"The total is {sum(nexts)}")
+
+    print(f"The alternating total is {sum(previouses)}")
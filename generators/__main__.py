@@ -0,0 +1,19 @@
+import argparse
+
+from generators import GENERATORS, SEED, generate
+from inputs import DirectoryBackend, InputStore
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Write synthetic inputs into an input store.")
+    parser.add_argument('days', nargs='*', type=int, default=sorted(GENERATORS))
+    parser.add_argument('--scale', type=float, default=1)
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--store', required=True, help="Store directory to write into.")
+    args = parser.parse_args()
+
+    store = InputStore(DirectoryBackend(args.store), fetch=False)
+    for day in args.days:
+        data = generate(day, args.scale, args.seed)
+        d = store.put(day, data)
+        print(f"day {day}: {len(data)} bytes, {d[:12]}")
@@ -0,0 +1,48 @@
+from math import sqrt
+from random import Random
+from typing import List, Tuple
+
+UP = 'U'
+DOWN = 'D'
+LEFT = 'L'
+RIGHT = 'R'
+
+Move = Tuple[str, int]
+
+
+def scaled(base: int, scale: float) -> int:
+    """Scale a count, for inputs that grow line by line."""
+    return max(1, round(base * scale))
+
+def side(base: int, scale: float) -> int:
+    """Scale the side of a square grid, so that its area grows by scale."""
+    return max(4, round(base * sqrt(scale)))
+
+def skyline(rng: Random, n: int, max_step: int, max_height: int) -> List[int]:
+    """A random walk of n heights in [1, max_height], no two in a row equal."""
+    heights = [rng.randint(1, max_height)]
+    while len(heights) < n:
+        step = rng.randint(1, max_step) * rng.choice((-1, 1))
+        h = heights[-1] + step
+        if not 1 <= h <= max_height:
+            h = heights[-1] - step
+        if 1 <= h <= max_height:
+            heights.append(h)
+    return heights
+
+def skyline_loop(heights: List[int], widths: List[int]) -> List[Move]:
+    """A closed, non self-intersecting rectilinear loop around a skyline.
+
+    Starting on the baseline at the left edge, go up the first building,
+    across every rooftop, down the last building and back along the
+    baseline.
+    """
+    moves: List[Move] = [(UP, heights[0])]
+    for i, w in enumerate(widths):
+        moves.append((RIGHT, w))
+        if i + 1 < len(heights):
+            dh = heights[i + 1] - heights[i]
+            moves.append((UP, dh) if dh > 0 else (DOWN, -dh))
+    moves.append((DOWN, heights[-1]))
+    moves.append((LEFT, sum(widths)))
+    return moves
@@ -0,0 +1,21 @@
+"""Calibration documents: letters with digits and spelled digits mixed in."""
+from random import Random
+from string import ascii_lowercase, digits
+
+from generators.common import scaled
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def line(rng: Random) -> str:
+    tokens = [rng.choice(digits[1:])]
+    for _ in range(rng.randint(1, 8)):
+        match rng.random():
+            case p if p < 0.3: tokens.append(rng.choice(digits[1:]))
+            case p if p < 0.6: tokens.append(rng.choice(WORDS))
+            case _: tokens.append(''.join(rng.choices(ascii_lowercase, k=rng.randint(1, 6))))
+    rng.shuffle(tokens)
+    return ''.join(tokens)
+
+def generate(scale: float, rng: Random) -> str:
+    return '\n'.join(line(rng) for _ in range(scaled(1000, scale)))
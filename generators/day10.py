@@ -0,0 +1,55 @@
+"""Pipe mazes: one giant loop around a random skyline, junk pipe elsewhere."""
+from random import Random
+from typing import List, Tuple
+
+from generators.common import side, skyline
+
+Coordinate = Tuple[int, int]
+
+GLYPHS = {
+    frozenset({(-1, 0), (1, 0)}): '|',
+    frozenset({(0, -1), (0, 1)}): '-',
+    frozenset({(-1, 0), (0, 1)}): 'L',
+    frozenset({(-1, 0), (0, -1)}): 'J',
+    frozenset({(1, 0), (0, 1)}): 'F',
+    frozenset({(1, 0), (0, -1)}): '7',
+}
+JUNK = "|-LJ7F...."
+
+
+def loop(heights: List[int], bottom: int) -> List[Coordinate]:
+    """Walk clockwise around the skyline, one tile at a time."""
+    path: List[Coordinate] = [(bottom, 1)]
+    def goto(i: int, j: int):
+        pi, pj = path[-1]
+        while (pi, pj) != (i, j):
+            pi += (i > pi) - (i < pi)
+            pj += (j > pj) - (j < pj)
+            path.append((pi, pj))
+    # Over each rooftop, then down the far column and back along the bottom.
+    for j, top in enumerate(heights, start=1):
+        goto(top, j)
+        goto(top, j + 1)
+    goto(bottom, len(heights) + 1)
+    goto(bottom, 2)
+    return path
+
+def generate(scale: float, rng: Random) -> str:
+    n = side(140, scale)
+    bottom = n - 2
+    tops = skyline(rng, n - 3, max_step=5, max_height=bottom - 1)
+    path = loop(tops, bottom)
+    grid: List[List[str]] = [
+        [rng.choice(JUNK) for _ in range(n)] for _ in range(n)
+    ]
+    for k, (i, j) in enumerate(path):
+        (pi, pj), (ni, nj) = path[k - 1], path[(k + 1) % len(path)]
+        grid[i][j] = GLYPHS[frozenset({(pi - i, pj - j), (ni - i, nj - j)})]
+    # Junk next to the start could pretend to connect to it.
+    si, sj = path[0]
+    on_loop = set(path)
+    for di, dj in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        if (si + di, sj + dj) not in on_loop:
+            grid[si + di][sj + dj] = '.'
+    grid[si][sj] = 'S'
+    return '\n'.join(''.join(row) for row in grid)
@@ -0,0 +1,18 @@
+"""Galaxy images with a sprinkling of empty rows and columns."""
+from random import Random
+
+from generators.common import side
+
+
+def generate(scale: float, rng: Random) -> str:
+    n = side(140, scale)
+    empty_rows = {i for i in range(n) if rng.random() < 0.05}
+    empty_cols = {j for j in range(n) if rng.random() < 0.05}
+    return '\n'.join(
+        ''.join(
+            '#' if i not in empty_rows and j not in empty_cols and rng.random() < 0.025
+            else '.'
+            for j in range(n)
+        )
+        for i in range(n)
+    )
@@ -0,0 +1,30 @@
+"""Spring records, with some of the known springs hidden behind a '?'.
+
+Record count grows with scale, and record length grows with its log, so
+the brute force part one stays feasible while records still get longer.
+"""
+from math import log10
+from random import Random
+from typing import List
+
+from generators.common import scaled
+
+
+def record(rng: Random, length: int) -> str:
+    springs: List[str] = ['.'] * rng.randint(0, 2)
+    groups: List[int] = []
+    while len(springs) < length:
+        g = rng.randint(1, 5)
+        springs.extend('#' * g + '.' * rng.randint(1, 3))
+        groups.append(g)
+    condition = ''.join(
+        '?' if rng.random() < 0.35 else s for s in springs
+    )
+    return condition + ' ' + ','.join(str(g) for g in groups)
+
+def generate(scale: float, rng: Random) -> str:
+    stretch = 1 + log10(max(scale, 1))
+    return '\n'.join(
+        record(rng, round(rng.randint(4, 16) * stretch))
+        for _ in range(scaled(1000, scale))
+    )
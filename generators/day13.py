@@ -0,0 +1,31 @@
+"""Mirror patterns, each with a clean reflection and a smudged one.
+
+Two neighbouring columns at one edge are made identical, which is a
+reflection line, and the two at the other edge differ in exactly one
+place, which is a reflection line once the smudge is fixed. About half
+the patterns are transposed, so that the lines are horizontal.
+"""
+from random import Random
+from typing import List
+
+from generators.common import scaled
+
+
+def pattern(rng: Random) -> List[str]:
+    n_rows, n_cols = rng.randint(5, 17), rng.randint(5, 17)
+    cols = [[rng.choice('.#') for _ in range(n_rows)] for _ in range(n_cols)]
+    cols[1] = cols[0][:]
+    cols[-1] = cols[-2][:]
+    smudge = rng.randrange(n_rows)
+    cols[-1][smudge] = '#' if cols[-1][smudge] == '.' else '.'
+    if rng.random() < 0.5:
+        cols = [c[::-1] for c in cols[::-1]]
+    rows = [''.join(r) for r in zip(*cols)]
+    if rng.random() < 0.5:
+        rows = [''.join(c) for c in cols]
+    return rows
+
+def generate(scale: float, rng: Random) -> str:
+    return '\n\n'.join(
+        '\n'.join(pattern(rng)) for _ in range(scaled(100, scale))
+    )
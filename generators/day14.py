@@ -0,0 +1,12 @@
+"""Reflector dishes: round rocks and cube rocks on a square grid."""
+from random import Random
+
+from generators.common import side
+
+
+def generate(scale: float, rng: Random) -> str:
+    n = side(100, scale)
+    return '\n'.join(
+        ''.join(rng.choices('.O#', weights=(0.7, 0.2, 0.1), k=n))
+        for _ in range(n)
+    )
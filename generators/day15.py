@@ -0,0 +1,16 @@
+"""Initialization sequences over a fixed pool of lens labels."""
+from random import Random
+from string import ascii_lowercase
+
+from generators.common import scaled
+
+
+def generate(scale: float, rng: Random) -> str:
+    labels = [
+        ''.join(rng.choices(ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(scaled(500, scale))
+    ]
+    return ','.join(
+        label + '-' if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}"
+        for label in rng.choices(labels, k=scaled(4000, scale))
+    )
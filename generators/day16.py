@@ -0,0 +1,12 @@
+"""Mirror contraptions: a square grid, mostly empty space."""
+from random import Random
+
+from generators.common import side
+
+
+def generate(scale: float, rng: Random) -> str:
+    n = side(110, scale)
+    return '\n'.join(
+        ''.join(rng.choices('./\\-|', weights=(0.9, 0.025, 0.025, 0.025, 0.025), k=n))
+        for _ in range(n)
+    )
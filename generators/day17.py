@@ -0,0 +1,11 @@
+"""Heat loss maps: a square grid of digits."""
+from random import Random
+
+from generators.common import side
+
+
+def generate(scale: float, rng: Random) -> str:
+    n = side(141, scale)
+    return '\n'.join(
+        ''.join(rng.choices('123456789', k=n)) for _ in range(n)
+    )
@@ -0,0 +1,43 @@
+"""Dig plans around two skylines, a small one for the directions and
+lengths and a huge one hidden in the colour codes.
+
+Both skylines have the same number of buildings, so both loops have the
+same number of moves, except that the long leg home along the baseline
+has to be split up to fit five hex digits, and the small loop splits its
+own leg home to match.
+"""
+from random import Random
+from typing import List
+
+from generators.common import LEFT, Move, scaled, skyline, skyline_loop
+
+HEX_DIRECTIONS = {'R': '0', 'D': '1', 'L': '2', 'U': '3'}
+MAX_HEX = 0xFFFFF
+
+
+def split(n: int, k: int) -> List[int]:
+    """Split n into k positive parts, as evenly as possible."""
+    q, r = divmod(n, k)
+    return [q + 1] * r + [q] * (k - r)
+
+def split_leg_home(moves: List[Move], k: int) -> List[Move]:
+    *moves, (direction, n) = moves
+    assert direction == LEFT
+    return moves + [(LEFT, x) for x in split(n, k)]
+
+def generate(scale: float, rng: Random) -> str:
+    n = scaled(330, scale)
+    small = skyline_loop(
+        skyline(rng, n, max_step=10, max_height=500),
+        [rng.randint(1, 10) for _ in range(n)],
+    )
+    big = skyline_loop(
+        skyline(rng, n, max_step=MAX_HEX // 10, max_height=MAX_HEX),
+        [rng.randint(1, MAX_HEX // 10) for _ in range(n)],
+    )
+    k = -(-big[-1][1] // MAX_HEX)
+    small, big = split_leg_home(small, k), split_leg_home(big, k)
+    return '\n'.join(
+        f"{d} {x} (#{y:05x}{HEX_DIRECTIONS[e]})"
+        for (d, x), (e, y) in zip(small, big)
+    )
@@ -0,0 +1,65 @@
+"""Workflow trees, with a depth that grows with the log of the scale.
+
+Every rule splits the parts that reach it into two non-empty sets, as in
+the real puzzle, so no path through the tree is a contradiction.
+"""
+from math import log10
+from random import Random
+from string import ascii_lowercase
+from typing import Dict, List, Set, Tuple
+
+from generators.common import scaled
+
+Space = Dict[str, Tuple[int, int]]
+
+
+def fresh_name(rng: Random, taken: Set[str]) -> str:
+    while True:
+        name = ''.join(rng.choices(ascii_lowercase, k=rng.randint(2, 4)))
+        if name not in taken:
+            taken.add(name)
+            return name
+
+def split(rng: Random, space: Space) -> Tuple[str, Space, Space]:
+    """A random rule, with the spaces it accepts and passes on."""
+    v = rng.choice([v for v, (lo, hi) in space.items() if hi > lo])
+    lo, hi = space[v]
+    if rng.random() < 0.5:
+        c = rng.randint(lo + 1, hi)
+        return f"{v}<{c}", space | {v: (lo, c - 1)}, space | {v: (c, hi)}
+    c = rng.randint(lo, hi - 1)
+    return f"{v}>{c}", space | {v: (c + 1, hi)}, space | {v: (lo, c)}
+
+def part(rng: Random) -> str:
+    return "{" + ','.join(f"{v}={rng.randint(1, 4000)}" for v in 'xmas') + "}"
+
+def generate(scale: float, rng: Random) -> str:
+    budget = scaled(550, scale)
+    max_depth = round(8 + 4 * log10(max(scale, 1)))
+    taken = {'in'}
+    queue = [('in', 0, {v: (1, 4000) for v in 'xmas'})]
+    workflows: List[str] = []
+    while queue:
+        # Expand a random pending workflow, so the tree fills out unevenly.
+        name, depth, space = queue.pop(rng.randrange(len(queue)))
+        rules = []
+        n_rules = rng.randint(2, 4)
+        for i in range(n_rules):
+            # The last rule is unconditional, and takes whatever is left.
+            last = i == n_rules - 1 or all(hi == lo for lo, hi in space.values())
+            if last:
+                subspace = space
+            else:
+                condition, subspace, space = split(rng, space)
+            if depth < max_depth and len(taken) < budget and rng.random() < 0.6:
+                target = fresh_name(rng, taken)
+                queue.append((target, depth + 1, subspace))
+            else:
+                target = rng.choice('AR')
+            rules.append(target if last else f"{condition}:{target}")
+            if last:
+                break
+        workflows.append(name + "{" + ','.join(rules) + "}")
+    rng.shuffle(workflows)
+    parts = [part(rng) for _ in range(scaled(200, scale))]
+    return '\n'.join(workflows) + "\n\n" + '\n'.join(parts)
@@ -0,0 +1,17 @@
+"""Cube game logs, a handful of rounds per game."""
+from random import Random
+
+from generators.common import scaled
+
+COLORS = ("red", "green", "blue")
+
+
+def game(rng: Random, id: int) -> str:
+    rounds = []
+    for _ in range(rng.randint(1, 6)):
+        colors = rng.sample(COLORS, rng.randint(1, 3))
+        rounds.append(', '.join(f"{rng.randint(1, 20)} {c}" for c in colors))
+    return f"Game {id}: " + '; '.join(rounds)
+
+def generate(scale: float, rng: Random) -> str:
+    return '\n'.join(game(rng, id) for id in range(1, scaled(100, scale) + 1))
@@ -0,0 +1,27 @@
+"""Engine schematics: a square grid of numbers, symbols and dots."""
+from random import Random
+from typing import List
+
+from generators.common import side
+
+SYMBOLS = "*#+$/=%@&-"
+
+
+def row(rng: Random, n_cols: int) -> str:
+    chars: List[str] = []
+    while len(chars) < n_cols:
+        p = rng.random()
+        if p < 0.08:
+            number = str(rng.randint(1, 999))
+            # Numbers are always followed by something that is not a digit.
+            chars.extend(number)
+            chars.append(rng.choice(SYMBOLS) if rng.random() < 0.2 else '.')
+        elif p < 0.12:
+            chars.append(rng.choice(SYMBOLS))
+        else:
+            chars.append('.')
+    return ''.join(chars[:n_cols])
+
+def generate(scale: float, rng: Random) -> str:
+    n = side(140, scale)
+    return '\n'.join(row(rng, n) for _ in range(n))
@@ -0,0 +1,27 @@
+"""Scratchcards, ten winning numbers and twenty five held numbers each."""
+from random import Random
+
+from generators.common import scaled
+
+N_WINNING, N_HAVE = 10, 25
+
+
+def card(rng: Random, id: int, n_cards: int, width: int) -> str:
+    # Mostly few matches, or the copy counts explode exponentially, and
+    # copies never run past the end of the table.
+    n_matches = min(int(rng.expovariate(0.9)), N_WINNING, n_cards - id)
+    numbers = rng.sample(range(1, 100), N_WINNING + N_HAVE - n_matches)
+    winning = numbers[:N_WINNING]
+    have = winning[:n_matches] + numbers[N_WINNING:]
+    rng.shuffle(have)
+    return (
+        f"Card {id:>{width}}: "
+        + ' '.join(f"{n:>2}" for n in winning)
+        + " | "
+        + ' '.join(f"{n:>2}" for n in have)
+    )
+
+def generate(scale: float, rng: Random) -> str:
+    n = scaled(200, scale)
+    width = len(str(n))
+    return '\n'.join(card(rng, id, n, width) for id in range(1, n + 1))
@@ -0,0 +1,37 @@
+"""Almanacs: seven maps, each shuffling slices of a 32 bit domain."""
+from random import Random
+from typing import List
+
+from generators.common import scaled
+
+CHAIN = [
+    "seed", "soil", "fertilizer", "water", "light",
+    "temperature", "humidity", "location",
+]
+DOMAIN = 2**32
+
+
+def segments(rng: Random, n: int) -> List[str]:
+    cuts = [0] + sorted(rng.sample(range(1, DOMAIN), n)) + [DOMAIN]
+    pieces = list(zip(cuts[:-1], cuts[1:]))
+    # Lay the pieces back down in a shuffled order, so the map is a
+    # permutation of the domain...
+    order = pieces[:]
+    rng.shuffle(order)
+    destination, lines = 0, []
+    for start, stop in order:
+        lines.append(f"{destination} {start} {stop - start}")
+        destination += stop - start
+    # ...then forget a few pieces, which leaves them mapped to themselves.
+    return [l for l in lines if rng.random() > 0.05]
+
+def generate(scale: float, rng: Random) -> str:
+    seeds = []
+    for _ in range(scaled(10, scale)):
+        length = rng.randint(10**7, 5 * 10**8)
+        seeds.extend([rng.randrange(DOMAIN - length), length])
+    blocks = ["seeds: " + ' '.join(str(s) for s in seeds)]
+    for source, target in zip(CHAIN[:-1], CHAIN[1:]):
+        lines = segments(rng, scaled(35, scale))
+        blocks.append('\n'.join([f"{source}-to-{target} map:", *lines]))
+    return '\n\n'.join(blocks)
@@ -0,0 +1,13 @@
+"""Boat races, every one of them winnable."""
+from random import Random
+
+from generators.common import scaled
+
+
+def generate(scale: float, rng: Random) -> str:
+    times = [rng.randint(7, 100) for _ in range(scaled(4, scale))]
+    distances = [rng.randint(t, t * t // 4 - 1) for t in times]
+    return (
+        "Time:     " + ' '.join(f"{t:>4}" for t in times) + "\n"
+        + "Distance: " + ' '.join(f"{d:>4}" for d in distances)
+    )
@@ -0,0 +1,24 @@
+"""Camel cards: distinct hands with bids.
+
+Hands compare as errors when equal, so there are at most 13**5 of them.
+"""
+from random import Random
+
+from generators.common import scaled
+
+CARDS = "23456789TJQKA"
+
+
+def hand(code: int) -> str:
+    cards = []
+    for _ in range(5):
+        code, c = divmod(code, len(CARDS))
+        cards.append(CARDS[c])
+    return ''.join(cards)
+
+def generate(scale: float, rng: Random) -> str:
+    n = min(scaled(1000, scale), len(CARDS)**5)
+    return '\n'.join(
+        f"{hand(code)} {rng.randint(1, 1000)}"
+        for code in rng.sample(range(len(CARDS)**5), n)
+    )
@@ -0,0 +1,53 @@
+"""Desert maps where every ghost's walk is a clean cycle.
+
+Each ghost walks a ring of L * p nodes, L the instruction length and p a
+prime, from its ..A node to its ..Z node. The ..Z node leads back onto the
+ring exactly as the ..A node does, so the first Z hit is also the period
+and the lcm of first hits is the answer. The branch not taken at each node
+goes to a random node on the same ring.
+"""
+from random import Random
+from string import ascii_uppercase
+from typing import List
+
+from generators.common import scaled
+
+PRIMES = [5, 7, 11, 13, 17, 19, 23]
+INNER = [c for c in ascii_uppercase if c not in 'AZ']
+
+
+def name(n: int, width: int) -> str:
+    chars = []
+    for _ in range(width):
+        n, c = divmod(n, len(INNER))
+        chars.append(INNER[c])
+    return ''.join(chars)
+
+def ring(rng: Random, directions: str, start: str, end: str, inner: List[str]) -> List[str]:
+    path = [start] + inner + [end]
+    children = {}
+    for i, node in enumerate(path[:-1]):
+        nxt, other = path[i + 1], rng.choice(inner)
+        left_first = directions[i % len(directions)] == 'L'
+        children[node] = (nxt, other) if left_first else (other, nxt)
+    children[end] = children[start]
+    return [f"{n} = ({l}, {r})" for n, (l, r) in children.items()]
+
+def generate(scale: float, rng: Random) -> str:
+    directions = ''.join(rng.choices('LR', k=17))
+    n_ghosts = scaled(6, scale)
+    lengths = [len(directions) * rng.choice(PRIMES) for _ in range(n_ghosts)]
+    width = 2
+    while len(INNER)**width < sum(lengths):
+        width += 1
+    lines, counter = [], 0
+    for g, length in enumerate(lengths):
+        inner = [name(counter + i, width + 1) for i in range(length - 1)]
+        counter += length - 1
+        if g == 0:
+            start, end = 'AAA', 'ZZZ'
+        else:
+            start, end = name(g, width) + 'A', name(g, width) + 'Z'
+        lines.extend(ring(rng, directions, start, end, inner))
+    rng.shuffle(lines)
+    return directions + "\n\n" + '\n'.join(lines)
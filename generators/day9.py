@@ -0,0 +1,19 @@
+"""Oasis histories: polynomial sequences with small binomial coefficients."""
+from math import comb
+from random import Random
+
+from generators.common import scaled
+
+LENGTH = 21
+
+
+def history(rng: Random) -> str:
+    degree = rng.randint(0, 15)
+    coefficients = [rng.randint(-10, 10) for _ in range(degree + 1)]
+    return ' '.join(
+        str(sum(a * comb(x, k) for k, a in enumerate(coefficients)))
+        for x in range(LENGTH)
+    )
+
+def generate(scale: float, rng: Random) -> str:
+    return '\n'.join(history(rng) for _ in range(scaled(200, scale)))
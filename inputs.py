@@ -0,0 +1,211 @@
+"""Local content-addressed store for puzzle inputs.
+
+Each input is written once as a blob named by the sha256 of its contents,
+and a small index maps (year, day) onto that digest. Solvers read through
+`get_data`, which only goes out to aocd when the store has never seen the
+day, so reruns work fully offline.
+
+The default store lives in ~/.cache/aoc-inputs, or wherever AOC_INPUT_STORE
+points. Run solvers as modules from the repository root, so that this
+module is importable, e.g.:
+
+    python -m day17.solution
+    python -m day14.solution-pt2
+
+Byte level solvers can read through `get_bytes`, or `get_mmap` for a view
+of the stored blob with no copy at all.
+
+To fill the store for every day in one go:
+
+    python inputs.py 1 19
+"""
+import hashlib
+import json
+import mmap
+import os
+import sys
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+YEAR = 2023
+
+Year = int
+Day = int
+Digest = str
+Key = Tuple[Year, Day]
+
+DEFAULT_ROOT = Path(
+    os.environ.get("AOC_INPUT_STORE", Path.home() / ".cache" / "aoc-inputs")
+)
+
+
+def digest(data: bytes) -> Digest:
+    return hashlib.sha256(data).hexdigest()
+
+
+class Backend(ABC):
+    """Where the blobs and the (year, day) -> digest index actually live."""
+
+    @abstractmethod
+    def lookup(self, key: Key) -> Optional[Digest]:
+        pass
+
+    @abstractmethod
+    def index(self) -> Dict[Key, Digest]:
+        pass
+
+    @abstractmethod
+    def read(self, d: Digest) -> bytes:
+        pass
+
+    @abstractmethod
+    def map(self, d: Digest) -> bytes | mmap.mmap:
+        pass
+
+    @abstractmethod
+    def write(self, key: Key, data: bytes) -> Digest:
+        pass
+
+
+class DirectoryBackend(Backend):
+
+    def __init__(self, root: Path | str = DEFAULT_ROOT):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.index_path = self.root / "index.json"
+
+    def __repr__(self) -> str:
+        return f"DirectoryBackend({self.root})"
+
+    def index(self) -> Dict[Key, Digest]:
+        if not self.index_path.exists():
+            return {}
+        raw = json.loads(self.index_path.read_text())
+        return {
+            tuple(int(x) for x in key.split('/')): d for key, d in raw.items()
+        }
+
+    def lookup(self, key: Key) -> Optional[Digest]:
+        return self.index().get(key)
+
+    def read(self, d: Digest) -> bytes:
+        return (self.objects / d).read_bytes()
+
+    def map(self, d: Digest) -> bytes | mmap.mmap:
+        path = self.objects / d
+        # Zero length files cannot be memory mapped.
+        if path.stat().st_size == 0:
+            return b""
+        with open(path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def write(self, key: Key, data: bytes) -> Digest:
+        d = digest(data)
+        self.objects.mkdir(parents=True, exist_ok=True)
+        path = self.objects / d
+        # Content addressed, so an existing blob is already correct.
+        if not path.exists():
+            tmp = path.with_suffix('.tmp')
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        index = {f"{y}/{n}": v for (y, n), v in self.index().items()}
+        index[f"{key[0]}/{key[1]}"] = d
+        tmp = self.index_path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(index, indent=2, sort_keys=True))
+        tmp.replace(self.index_path)
+        return d
+
+
+class InputStore:
+    """Reads puzzle inputs from a backend, caching them in memory.
+
+    With fetch=True a miss falls back to aocd and the result is written
+    into the backend; with fetch=False a miss is a KeyError, which is what
+    tests and benchmarks pointed at a local directory want.
+    """
+
+    def __init__(self, backend: Optional[Backend] = None, fetch: bool = True):
+        self.backend = backend if backend is not None else DirectoryBackend()
+        self.fetch = fetch
+        self.cache: Dict[Key, bytes] = {}
+
+    def preload(self, days: Iterable[Day] = range(1, 26), year: Year = YEAR) -> "InputStore":
+        index = self.backend.index()
+        for day in days:
+            key = (year, day)
+            if key in self.cache:
+                continue
+            if key in index:
+                self.cache[key] = self.backend.read(index[key])
+            elif self.fetch:
+                self.cache[key] = self._fetch(key)
+        return self
+
+    def put(self, day: Day, data: str | bytes, year: Year = YEAR) -> Digest:
+        if isinstance(data, str):
+            data = data.encode()
+        self.cache[(year, day)] = data
+        return self.backend.write((year, day), data)
+
+    def get_bytes(self, day: Day, year: Year = YEAR) -> bytes:
+        key = (year, day)
+        if key not in self.cache:
+            d = self.backend.lookup(key)
+            if d is not None:
+                self.cache[key] = self.backend.read(d)
+            elif self.fetch:
+                self.cache[key] = self._fetch(key)
+            else:
+                raise KeyError(f"No input for day {day} of {year} in {self.backend}.")
+        return self.cache[key]
+
+    def get_mmap(self, day: Day, year: Year = YEAR) -> bytes | mmap.mmap:
+        """A zero copy view of the input, for inputs too large to duplicate."""
+        d = self.backend.lookup((year, day))
+        if d is None:
+            self.get_bytes(day, year)
+            d = self.backend.lookup((year, day))
+        return self.backend.map(d)
+
+    def get_data(self, day: Day, year: Year = YEAR) -> str:
+        return self.get_bytes(day, year).decode()
+
+    def _fetch(self, key: Key) -> bytes:
+        # Only imported on a miss, so a warm store never needs aocd at all.
+        import aocd
+        year, day = key
+        data = aocd.get_data(day=day, year=year).encode()
+        self.backend.write(key, data)
+        return data
+
+
+_default_store: Optional[InputStore] = None
+
+def default_store() -> InputStore:
+    global _default_store
+    if _default_store is None:
+        _default_store = InputStore()
+    return _default_store
+
+def set_default_store(store: InputStore) -> InputStore:
+    global _default_store
+    _default_store = store
+    return store
+
+def get_data(day: Day, year: Year = YEAR) -> str:
+    """Drop in replacement for aocd.get_data backed by the default store."""
+    return default_store().get_data(day, year)
+
+def get_bytes(day: Day, year: Year = YEAR) -> bytes:
+    return default_store().get_bytes(day, year)
+
+def get_mmap(day: Day, year: Year = YEAR) -> bytes | mmap.mmap:
+    return default_store().get_mmap(day, year)
+
+
+if __name__ == '__main__':
+    first, last = (int(x) for x in sys.argv[1:3])
+    store = default_store().preload(range(first, last + 1))
+    for (year, day), data in sorted(store.cache.items()):
+        print(f"{year} day {day}: {len(data)} bytes, {digest(data)[:12]}")